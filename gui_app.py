@@ -33,6 +33,13 @@ except ImportError as e:
     SYSTEM_AVAILABLE = False
     IMPORT_ERROR = str(e)
 
+# Server status polling interval while the server starts up
+_STATUS_POLL_MS = 3000
+# Once status checks keep failing, the interval doubles from the first value
+# up to the second, and polling stops after this many consecutive failures
+_STATUS_BACKOFF_MS = (500, 60000)
+_STATUS_MAX_FAILURES = 8
+
 
 class AgenticConfigGUI:
     """Main GUI application for the Agentic Configuration Research System"""
@@ -48,6 +55,7 @@ class AgenticConfigGUI:
         self.server_running = False
         self.integration = None
         self.current_task = None
+        self._status_failures = 0
         
         # Setup GUI
         self.setup_styles()
@@ -457,6 +465,7 @@ https://httpbin.org/get"""
             self.server_thread.start()
             
             # Wait a moment and check if server started
+            self._status_failures = 0
             self.root.after(2000, self.check_server_status)
             
         except Exception as e:
@@ -470,15 +479,23 @@ https://httpbin.org/get"""
             url = f"http://{self.host_var.get()}:{self.port_var.get()}/"
             response = requests.get(url, timeout=5)
             if response.status_code == 200:
+                self._status_failures = 0
                 self.server_running = True
                 self.log_message("Server started successfully!")
                 self.update_status()
             else:
                 self.log_message("Server may not be fully ready yet...", "WARNING")
         except Exception as e:
+            self._status_failures += 1
+            if not self.server_thread.is_alive() or self._status_failures > _STATUS_MAX_FAILURES:
+                self.log_message("Server failed to start, giving up", "ERROR")
+                return
             self.log_message("Server starting... (this may take a moment)", "INFO")
-            # Try again in a few seconds
-            self.root.after(3000, self.check_server_status)
+            # Try again in a few seconds; back off exponentially once failures
+            # repeat so a failed start is not polled forever
+            backoff_start, backoff_max = _STATUS_BACKOFF_MS
+            delay = min(backoff_start << self._status_failures, backoff_max)
+            self.root.after(max(delay, _STATUS_POLL_MS), self.check_server_status)
     
     def stop_server(self):
         """Stop the backend server"""
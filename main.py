@@ -12,8 +12,8 @@ from loguru import logger
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.integration.cursor_integration import run_server, CursorIntegration
-from src.mcp_server.server import MCPServer
+# The integration and MCP modules pull in FastAPI, pandas and the processors;
+# each command imports only what it runs, after its arguments have parsed
 
 
 def setup_logging(debug: bool = False):
@@ -96,21 +96,28 @@ Examples:
     logger.info("Starting Agentic Configuration Research System")
     logger.info(f"Workspace: {args.workspace}")
     
+    integration = None
     try:
         if not args.command or args.command == "server":
             # Start web server (default)
+            from src.integration.cursor_integration import run_server
             await run_server(args.workspace, args.host, args.port)
         
         elif args.command == "mcp":
             # Start MCP server only
+            from src.mcp_server.server import MCPServer
             mcp_server = MCPServer(args.workspace)
             logger.info("MCP Server started - waiting for connections...")
             # Keep server running
-            while True:
-                await asyncio.sleep(1)
+            try:
+                while True:
+                    await asyncio.sleep(1)
+            finally:
+                mcp_server.shutdown()
         
         elif args.command == "analyze":
             # Perform analysis
+            from src.integration.cursor_integration import CursorIntegration
             integration = CursorIntegration(args.workspace)
             
             if args.excel:
@@ -133,6 +140,7 @@ Examples:
         
         elif args.command == "validate":
             # Perform validation
+            from src.integration.cursor_integration import CursorIntegration
             integration = CursorIntegration(args.workspace)
             
             if args.config:
@@ -154,6 +162,7 @@ Examples:
         
         elif args.command == "troubleshoot":
             # Perform troubleshooting
+            from src.integration.cursor_integration import CursorIntegration
             integration = CursorIntegration(args.workspace)
             
             logger.info(f"Performing troubleshooting analysis")
@@ -173,12 +182,13 @@ Examples:
         if args.debug:
             raise
         sys.exit(1)
+    finally:
+        if integration is not None:
+            integration.shutdown()
 
 
 def print_analysis_result(result: dict):
     """Pretty print analysis results"""
-    import json
-    
     # Extract key information for display
     if "recommendations" in result and result["recommendations"]:
         print("\n📋 RECOMMENDATIONS:")
@@ -209,4 +219,11 @@ def print_analysis_result(result: dict):
 
 
 if __name__ == "__main__":
+    # Run on uvloop when it is installed (pip install .[performance])
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -36,6 +36,9 @@ def create_directories():
     ]
     
     for directory in directories:
+        # On re-runs everything already exists; one isdir check skips mkdir's per-parent work
+        if os.path.isdir(directory):
+            continue
         Path(directory).mkdir(parents=True, exist_ok=True)
         print(f"📁 Created directory: {directory}")
 
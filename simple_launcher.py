@@ -6,13 +6,67 @@ Works without GUI dependencies - opens web interface in browser
 
 import sys
 import os
+import json
+import hashlib
+import sysconfig
 import subprocess
 import time
 import webbrowser
 import threading
+import urllib.request
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
 
+# Import names of every third-party package the server stack imports at startup
+# (src/ top-level imports, plus python-multipart for the upload routes and uvicorn
+# to serve); keep in sync when a module gains a new dependency
+REQUIRED_MODULES = (
+    "fastapi", "uvicorn", "pydantic", "anyio", "multipart", "orjson", "pandas",
+    "numpy", "openpyxl", "PyPDF2", "requests", "aiohttp", "loguru", "websockets",
+    "validators", "yaml", "jsonschema", "bs4"
+)
+
+
+# Successful dependency checks are remembered here, keyed on the environment
+DEPENDENCY_CACHE_FILE = Path(".cache") / "deps_ok.json"
+
+# The project's pinned requirements; editing them invalidates a remembered check
+REQUIREMENTS_FILE = Path(__file__).parent / "requirements.txt"
+
+
+def dependency_cache_key():
+    """Fingerprint of the interpreter, its installed packages and what is required
+    
+    Installing or removing packages touches site-packages, which changes its mtime;
+    a changed REQUIRED_MODULES or requirements.txt changes the key as well.
+    """
+    site_packages = sysconfig.get_paths()["purelib"]
+    try:
+        site_mtime = os.path.getmtime(site_packages)
+    except OSError:
+        site_mtime = 0
+    try:
+        requirements = REQUIREMENTS_FILE.read_bytes()
+    except OSError:
+        requirements = b""
+    fingerprint = hashlib.sha256()
+    fingerprint.update("|".join([sys.prefix, sys.version, site_packages, str(site_mtime), *REQUIRED_MODULES]).encode("utf-8"))
+    fingerprint.update(b"\0")
+    fingerprint.update(requirements)
+    return fingerprint.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def has_module(name):
+    """Check whether a module is installed without importing it"""
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class SimpleLauncher:
     """Simple launcher that starts the server and opens the web interface"""
     
@@ -36,21 +90,31 @@ class SimpleLauncher:
     def check_dependencies(self):
         """Check if basic dependencies are available"""
         try:
-            # Try to import basic modules
-            import json
-            import asyncio
-            print("✅ Basic modules available")
-            
-            # Check if our system modules can be imported
-            sys.path.insert(0, str(self.workspace / "src"))
+            # An unchanged environment that passed before passes again
+            cache_file = self.workspace / DEPENDENCY_CACHE_FILE
+            cache_key = dependency_cache_key()
             try:
-                from src.mcp_server.server import MCPServer
-                print("✅ MCP server module available")
-                return True
-            except ImportError as e:
-                print(f"⚠️  Some dependencies missing: {e}")
+                if json.loads(cache_file.read_text()).get("key") == cache_key:
+                    print("✅ Server dependencies available")
+                    return True
+            except (OSError, ValueError, AttributeError):
+                pass
+            
+            # Look the packages up rather than importing them; the server process
+            # imports them for real, so loading pandas & co. here only slows startup
+            missing = [name for name in REQUIRED_MODULES if not has_module(name)]
+            if missing:
+                print(f"⚠️  Some dependencies missing: {', '.join(missing)}")
                 print("   The system will work with basic functionality")
                 return False
+            
+            print("✅ Server dependencies available")
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({"key": cache_key}))
+            except OSError:
+                pass
+            return True
                 
         except Exception as e:
             print(f"❌ Dependency check failed: {e}")
@@ -65,11 +129,16 @@ class SimpleLauncher:
             cmd = [sys.executable, "main.py", "server", 
                    "--host", self.host, "--port", str(self.port)]
             
+            # Nothing reads the server's console output (it also logs to logs/), and
+            # an undrained pipe would eventually block the server once it fills up.
+            # Without close_fds, and with cwd only when it differs, CPython can start
+            # the server with posix_spawn instead of fork + exec
             self.server_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=self.workspace
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=None if self.workspace == Path.cwd() else self.workspace,
+                close_fds=False
             )
             
             return True
@@ -84,7 +153,6 @@ class SimpleLauncher:
         
         for i in range(timeout):
             try:
-                import urllib.request
                 url = f"http://{self.host}:{self.port}/"
                 
                 with urllib.request.urlopen(url, timeout=2) as response:
@@ -93,7 +161,15 @@ class SimpleLauncher:
                         return True
                         
             except Exception:
-                time.sleep(1)
+                # Block on the server process instead of sleeping, so a server that
+                # dies during startup is reported at once rather than after the timeout
+                try:
+                    returncode = self.server_process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
+                else:
+                    print(f"❌ Server exited during startup (exit code {returncode})")
+                    return False
                 if i % 5 == 0:
                     print(f"   Still waiting... ({i}/{timeout}s)")
         
@@ -181,7 +257,6 @@ class SimpleLauncher:
         
         # Check server
         try:
-            import urllib.request
             url = f"http://{self.host}:{self.port}/"
             with urllib.request.urlopen(url, timeout=2) as response:
                 print(f"🟢 Server: Running on {url}")
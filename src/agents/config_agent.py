@@ -4,198 +4,400 @@ Configuration Agent for Automated Troubleshooting and Analysis
 
 import json
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
+from types import MappingProxyType
 from loguru import logger
 from datetime import datetime
 import re
 import yaml
 
+# Optional multi-pattern matcher for the log-analysis path
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
-class ConfigurationAgent:
-    """AI-powered configuration agent for automated troubleshooting"""
+
+# MySQL, PostgreSQL, SQL Server, MongoDB, Redis
+_DEFAULT_PORTS = ('3306', '5432', '1433', '27017', '6379')
+_DEFAULT_PORT_RE = re.compile(r'\b(' + '|'.join(_DEFAULT_PORTS) + r')\b')
+
+# Hardcoded sensitive assignments, compiled once for every config file checked
+_SENSITIVE_VALUE_PATTERNS = (
+    (re.compile(r'password\s*=\s*["\']?[^"\'\s]+', re.IGNORECASE), 'hardcoded_password'),
+    (re.compile(r'api[_-]?key\s*=\s*["\']?[^"\'\s]+', re.IGNORECASE), 'hardcoded_api_key'),
+    (re.compile(r'secret\s*=\s*["\']?[^"\'\s]+', re.IGNORECASE), 'hardcoded_secret'),
+    (re.compile(r'token\s*=\s*["\']?[^"\'\s]+', re.IGNORECASE), 'hardcoded_token')
+)
+
+# Severity levels from most to least urgent
+_SEVERITY_PRIORITY = ("critical", "high", "medium", "low")
+
+# Prevention measures recommended in every troubleshooting plan
+_PREVENTION_MEASURES: Tuple[str, ...] = (
+    "Implement comprehensive monitoring and alerting",
+    "Regular system health checks and maintenance",
+    "Document configuration changes and procedures",
+    "Establish backup and recovery procedures",
+    "Conduct regular security and performance audits"
+)
+
+# Scalar plan fields; only the step lists are allocated per plan
+_PLAN_DEFAULTS = MappingProxyType({
+    "prevention_measures": _PREVENTION_MEASURES,
+    "estimated_complexity": "medium",
+    "estimated_time": "30-60 minutes"
+})
+
+# severity -> (urgent first action, complexity override or None, time estimate)
+_SEVERITY_TABLE: Dict[str, Tuple[str, Optional[str], str]] = {
+    "critical": ("CRITICAL: Escalate to senior technical staff immediately", "high", "1-4 hours"),
+    "high": ("High priority: Address within 1 hour", None, "1-2 hours")
+}
+
+# Upper bound on cached per-file configuration analyses
+_CONFIG_CACHE_MAX_ENTRIES = 128
+
+# Upper bound on cached troubleshooting plans
+_PLAN_CACHE_MAX_ENTRIES = 256
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """Format a whole-second epoch timestamp as local ISO 8601"""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second"""
+    return _iso_timestamp(int(time.time()))
+
+
+def _empty_plan() -> Dict[str, Any]:
+    """Skeleton troubleshooting plan with no steps"""
+    return {
+        "immediate_actions": [],
+        "investigation_steps": [],
+        "resolution_steps": [],
+        **_PLAN_DEFAULTS
+    }
+
+
+class _FrozenDict(dict):
+    """Read-only dict, safe to share between results and still JSON-serializable"""
     
-    def __init__(self):
-        self.knowledge_base = self._initialize_knowledge_base()
-        self.troubleshooting_patterns = self._initialize_troubleshooting_patterns()
-        self.solution_templates = self._initialize_solution_templates()
-        
-    def _initialize_knowledge_base(self) -> Dict[str, Any]:
-        """Initialize the troubleshooting knowledge base"""
-        return {
-            "network": {
-                "common_issues": {
-                    "connection_timeout": {
-                        "symptoms": ["timeout", "connection timed out", "no response"],
-                        "causes": ["firewall blocking", "service down", "network congestion", "incorrect port"],
-                        "solutions": ["check firewall rules", "verify service status", "test connectivity", "validate port configuration"]
-                    },
-                    "dns_resolution": {
-                        "symptoms": ["host not found", "name resolution failed", "dns error"],
-                        "causes": ["incorrect dns server", "dns cache issues", "network configuration"],
-                        "solutions": ["flush dns cache", "check dns servers", "verify network settings"]
-                    },
-                    "port_issues": {
-                        "symptoms": ["connection refused", "port unreachable", "service unavailable"],
-                        "causes": ["service not running", "firewall blocking port", "incorrect port number"],
-                        "solutions": ["start service", "open firewall port", "verify port configuration"]
-                    }
-                },
-                "diagnostic_commands": {
-                    "connectivity": ["ping", "traceroute", "telnet", "nslookup"],
-                    "service_status": ["systemctl status", "service status", "netstat -an"],
-                    "firewall": ["iptables -L", "ufw status", "firewall-cmd --list-all"]
-                }
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def _collect_match(pattern_id: int, start: int, end: int, flags: int, context: Set[int]) -> None:
+    """Hyperscan match callback: record which pattern fired"""
+    context.add(pattern_id)
+
+
+class _PatternSet:
+    """Case-insensitive set of regexes matched together against a text.
+    
+    Uses a single Hyperscan database when the library is installed and
+    falls back to one precompiled ``re`` pattern per expression otherwise.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        self._compiled = [re.compile(pattern, re.IGNORECASE) for pattern in self.patterns]
+        self._database = None
+        
+        if HYPERSCAN_AVAILABLE and self.patterns:
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[pattern.encode('utf-8') for pattern in self.patterns],
+                    ids=list(range(len(self.patterns))),
+                    elements=len(self.patterns),
+                    flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self.patterns)
+                )
+                self._database = database
+            except Exception as e:
+                logger.warning(f"Hyperscan compilation failed, using re fallback: {str(e)}")
+    
+    def matching_ids(self, text: str) -> Set[int]:
+        """Return the indices of all patterns that match somewhere in text"""
+        if self._database is not None:
+            hits: Set[int] = set()
+            self._database.scan(text.encode('utf-8'), match_event_handler=_collect_match, context=hits)
+            return hits
+        return {index for index, compiled in enumerate(self._compiled) if compiled.search(text)}
+    
+    def matches(self, text: str) -> List[Tuple[int, "re.Match[str]"]]:
+        """Return (pattern index, first match) pairs in pattern order"""
+        if self._database is None:
+            # Without Hyperscan the search that finds a hit also yields its match
+            return [(index, match) for index, compiled in enumerate(self._compiled)
+                    if (match := compiled.search(text))]
+        
+        # Hyperscan only reports which patterns fired; fetch their matches with re
+        results = []
+        for index in sorted(self.matching_ids(text)):
+            match = self._compiled[index].search(text)
+            if match:
+                results.append((index, match))
+        return results
+
+
+# Troubleshooting knowledge base, shared by all agent instances (read-only)
+_KNOWLEDGE_BASE: Dict[str, Any] = {
+    "network": {
+        "common_issues": {
+            "connection_timeout": {
+                "symptoms": ["timeout", "connection timed out", "no response"],
+                "causes": ["firewall blocking", "service down", "network congestion", "incorrect port"],
+                "solutions": ["check firewall rules", "verify service status", "test connectivity", "validate port configuration"]
             },
-            "database": {
-                "common_issues": {
-                    "connection_failed": {
-                        "symptoms": ["connection failed", "cannot connect", "database unavailable"],
-                        "causes": ["service down", "incorrect credentials", "network issues", "max connections reached"],
-                        "solutions": ["restart database service", "verify credentials", "check connection limits"]
-                    },
-                    "authentication": {
-                        "symptoms": ["authentication failed", "access denied", "login failed"],
-                        "causes": ["wrong username/password", "user permissions", "account locked"],
-                        "solutions": ["reset password", "check user permissions", "unlock account"]
-                    },
-                    "performance": {
-                        "symptoms": ["slow queries", "timeout", "high cpu usage"],
-                        "causes": ["missing indexes", "large result sets", "resource constraints"],
-                        "solutions": ["optimize queries", "add indexes", "increase resources"]
-                    }
-                },
-                "diagnostic_commands": {
-                    "connection": ["mysql -u user -p", "psql -U user -d database", "sqlcmd -S server"],
-                    "status": ["SHOW STATUS", "SELECT version()", "SHOW PROCESSLIST"],
-                    "performance": ["EXPLAIN query", "SHOW SLOW LOG", "SELECT * FROM pg_stat_activity"]
-                }
+            "dns_resolution": {
+                "symptoms": ["host not found", "name resolution failed", "dns error"],
+                "causes": ["incorrect dns server", "dns cache issues", "network configuration"],
+                "solutions": ["flush dns cache", "check dns servers", "verify network settings"]
             },
-            "system": {
-                "common_issues": {
-                    "resource_exhaustion": {
-                        "symptoms": ["out of memory", "disk full", "high cpu usage"],
-                        "causes": ["memory leaks", "insufficient resources", "runaway processes"],
-                        "solutions": ["increase resources", "optimize applications", "kill problematic processes"]
-                    },
-                    "permission_errors": {
-                        "symptoms": ["permission denied", "access forbidden", "unauthorized"],
-                        "causes": ["incorrect file permissions", "wrong user context", "selinux policies"],
-                        "solutions": ["fix file permissions", "run as correct user", "adjust selinux"]
-                    },
-                    "service_failures": {
-                        "symptoms": ["service failed", "process crashed", "startup error"],
-                        "causes": ["configuration errors", "dependency issues", "resource problems"],
-                        "solutions": ["check configuration", "verify dependencies", "review logs"]
-                    }
-                },
-                "diagnostic_commands": {
-                    "resources": ["top", "htop", "free -h", "df -h"],
-                    "processes": ["ps aux", "systemctl status", "journalctl -u service"],
-                    "permissions": ["ls -la", "getfacl", "sestatus"]
-                }
+            "port_issues": {
+                "symptoms": ["connection refused", "port unreachable", "service unavailable"],
+                "causes": ["service not running", "firewall blocking port", "incorrect port number"],
+                "solutions": ["start service", "open firewall port", "verify port configuration"]
             }
+        },
+        "diagnostic_commands": {
+            "connectivity": ["ping", "traceroute", "telnet", "nslookup"],
+            "service_status": ["systemctl status", "service status", "netstat -an"],
+            "firewall": ["iptables -L", "ufw status", "firewall-cmd --list-all"]
         }
-    
-    def _initialize_troubleshooting_patterns(self) -> Dict[str, Any]:
-        """Initialize patterns for automated troubleshooting"""
-        return {
-            "error_patterns": {
-                "connection_issues": [
-                    r"connection\s+(refused|timeout|failed|reset)",
-                    r"unable\s+to\s+connect",
-                    r"network\s+(unreachable|timeout)",
-                    r"host\s+(not\s+found|unreachable)"
-                ],
-                "authentication_issues": [
-                    r"authentication\s+(failed|error)",
-                    r"(access|permission)\s+denied",
-                    r"(login|logon)\s+failed",
-                    r"invalid\s+(credentials|username|password)"
-                ],
-                "resource_issues": [
-                    r"out\s+of\s+(memory|disk|space)",
-                    r"insufficient\s+(memory|disk|resources)",
-                    r"resource\s+(exhausted|unavailable)",
-                    r"(memory|disk)\s+(full|error)"
-                ],
-                "configuration_issues": [
-                    r"configuration\s+(error|invalid)",
-                    r"config\s+(not\s+found|missing)",
-                    r"invalid\s+(parameter|setting|option)",
-                    r"syntax\s+error\s+in\s+config"
-                ]
+    },
+    "database": {
+        "common_issues": {
+            "connection_failed": {
+                "symptoms": ["connection failed", "cannot connect", "database unavailable"],
+                "causes": ["service down", "incorrect credentials", "network issues", "max connections reached"],
+                "solutions": ["restart database service", "verify credentials", "check connection limits"]
+            },
+            "authentication": {
+                "symptoms": ["authentication failed", "access denied", "login failed"],
+                "causes": ["wrong username/password", "user permissions", "account locked"],
+                "solutions": ["reset password", "check user permissions", "unlock account"]
             },
-            "severity_indicators": {
-                "critical": [r"critical", r"fatal", r"emergency", r"system\s+down"],
-                "high": [r"error", r"failed", r"exception", r"unavailable"],
-                "medium": [r"warning", r"timeout", r"slow", r"degraded"],
-                "low": [r"info", r"notice", r"debug", r"trace"]
+            "performance": {
+                "symptoms": ["slow queries", "timeout", "high cpu usage"],
+                "causes": ["missing indexes", "large result sets", "resource constraints"],
+                "solutions": ["optimize queries", "add indexes", "increase resources"]
             }
+        },
+        "diagnostic_commands": {
+            "connection": ["mysql -u user -p", "psql -U user -d database", "sqlcmd -S server"],
+            "status": ["SHOW STATUS", "SELECT version()", "SHOW PROCESSLIST"],
+            "performance": ["EXPLAIN query", "SHOW SLOW LOG", "SELECT * FROM pg_stat_activity"]
         }
-    
-    def _initialize_solution_templates(self) -> Dict[str, Any]:
-        """Initialize solution templates for common issues"""
-        return {
-            "network": {
-                "connection_timeout": {
-                    "immediate": [
-                        "Verify network connectivity: ping {target}",
-                        "Check if service is running on target host",
-                        "Test port accessibility: telnet {host} {port}"
-                    ],
-                    "investigation": [
-                        "Review firewall rules on both client and server",
-                        "Check network routing and DNS resolution",
-                        "Analyze network traffic with packet capture"
-                    ],
-                    "resolution": [
-                        "Configure firewall to allow traffic on required ports",
-                        "Restart network services if necessary",
-                        "Update network configuration files"
-                    ]
-                }
+    },
+    "system": {
+        "common_issues": {
+            "resource_exhaustion": {
+                "symptoms": ["out of memory", "disk full", "high cpu usage"],
+                "causes": ["memory leaks", "insufficient resources", "runaway processes"],
+                "solutions": ["increase resources", "optimize applications", "kill problematic processes"]
             },
-            "database": {
-                "connection_failed": {
-                    "immediate": [
-                        "Check database service status",
-                        "Verify connection string and credentials",
-                        "Test database connectivity from application server"
-                    ],
-                    "investigation": [
-                        "Review database error logs",
-                        "Check available connections and limits",
-                        "Verify network connectivity between application and database"
-                    ],
-                    "resolution": [
-                        "Restart database service if needed",
-                        "Increase connection pool limits",
-                        "Update connection configuration"
-                    ]
-                }
+            "permission_errors": {
+                "symptoms": ["permission denied", "access forbidden", "unauthorized"],
+                "causes": ["incorrect file permissions", "wrong user context", "selinux policies"],
+                "solutions": ["fix file permissions", "run as correct user", "adjust selinux"]
             },
-            "system": {
-                "resource_exhaustion": {
-                    "immediate": [
-                        "Check current resource usage: top, free, df",
-                        "Identify resource-intensive processes",
-                        "Free up resources by stopping non-essential services"
-                    ],
-                    "investigation": [
-                        "Analyze resource usage trends over time",
-                        "Review application logs for memory leaks",
-                        "Check for runaway processes or scheduled jobs"
-                    ],
-                    "resolution": [
-                        "Increase system resources (RAM, disk space)",
-                        "Optimize applications to use resources efficiently",
-                        "Implement resource monitoring and alerting"
-                    ]
-                }
+            "service_failures": {
+                "symptoms": ["service failed", "process crashed", "startup error"],
+                "causes": ["configuration errors", "dependency issues", "resource problems"],
+                "solutions": ["check configuration", "verify dependencies", "review logs"]
             }
+        },
+        "diagnostic_commands": {
+            "resources": ["top", "htop", "free -h", "df -h"],
+            "processes": ["ps aux", "systemctl status", "journalctl -u service"],
+            "permissions": ["ls -la", "getfacl", "sestatus"]
+        }
+    }
+}
+
+
+# Diagnostic commands are handed out by reference in every plan, so freeze them.
+# Consumers that need to modify a plan's commands must take a dict() copy.
+for _system_kb in _KNOWLEDGE_BASE.values():
+    if _system_kb.get("diagnostic_commands"):
+        _system_kb["diagnostic_commands"] = _FrozenDict(
+            (name, tuple(commands)) for name, commands in _system_kb["diagnostic_commands"].items()
+        )
+del _system_kb
+
+
+# Patterns for automated troubleshooting
+_TROUBLESHOOTING_PATTERNS: Dict[str, Any] = {
+    "error_patterns": {
+        "connection_issues": [
+            r"connection\s+(refused|timeout|failed|reset)",
+            r"unable\s+to\s+connect",
+            r"network\s+(unreachable|timeout)",
+            r"host\s+(not\s+found|unreachable)"
+        ],
+        "authentication_issues": [
+            r"authentication\s+(failed|error)",
+            r"(access|permission)\s+denied",
+            r"(login|logon)\s+failed",
+            r"invalid\s+(credentials|username|password)"
+        ],
+        "resource_issues": [
+            r"out\s+of\s+(memory|disk|space)",
+            r"insufficient\s+(memory|disk|resources)",
+            r"resource\s+(exhausted|unavailable)",
+            r"(memory|disk)\s+(full|error)"
+        ],
+        "configuration_issues": [
+            r"configuration\s+(error|invalid)",
+            r"config\s+(not\s+found|missing)",
+            r"invalid\s+(parameter|setting|option)",
+            r"syntax\s+error\s+in\s+config"
+        ]
+    },
+    "severity_indicators": {
+        "critical": [r"critical", r"fatal", r"emergency", r"system\s+down"],
+        "high": [r"error", r"failed", r"exception", r"unavailable"],
+        "medium": [r"warning", r"timeout", r"slow", r"degraded"],
+        "low": [r"info", r"notice", r"debug", r"trace"]
+    }
+}
+
+
+# Solution templates for common issues
+_SOLUTION_TEMPLATES: Dict[str, Any] = {
+    "network": {
+        "connection_timeout": {
+            "immediate": [
+                "Verify network connectivity: ping {target}",
+                "Check if service is running on target host",
+                "Test port accessibility: telnet {host} {port}"
+            ],
+            "investigation": [
+                "Review firewall rules on both client and server",
+                "Check network routing and DNS resolution",
+                "Analyze network traffic with packet capture"
+            ],
+            "resolution": [
+                "Configure firewall to allow traffic on required ports",
+                "Restart network services if necessary",
+                "Update network configuration files"
+            ]
+        }
+    },
+    "database": {
+        "connection_failed": {
+            "immediate": [
+                "Check database service status",
+                "Verify connection string and credentials",
+                "Test database connectivity from application server"
+            ],
+            "investigation": [
+                "Review database error logs",
+                "Check available connections and limits",
+                "Verify network connectivity between application and database"
+            ],
+            "resolution": [
+                "Restart database service if needed",
+                "Increase connection pool limits",
+                "Update connection configuration"
+            ]
+        }
+    },
+    "system": {
+        "resource_exhaustion": {
+            "immediate": [
+                "Check current resource usage: top, free, df",
+                "Identify resource-intensive processes",
+                "Free up resources by stopping non-essential services"
+            ],
+            "investigation": [
+                "Analyze resource usage trends over time",
+                "Review application logs for memory leaks",
+                "Check for runaway processes or scheduled jobs"
+            ],
+            "resolution": [
+                "Increase system resources (RAM, disk space)",
+                "Optimize applications to use resources efficiently",
+                "Implement resource monitoring and alerting"
+            ]
         }
+    }
+}
+
+
+# (system_type, issue_category) -> (immediate, investigation, resolution) steps
+_COMPILED_TEMPLATES: Dict[Tuple[str, str], Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = {
+    (system_type, issue_category): (
+        tuple(template.get("immediate", ())),
+        tuple(template.get("investigation", ())),
+        tuple(template.get("resolution", ()))
+    )
+    for system_type, categories in _SOLUTION_TEMPLATES.items()
+    for issue_category, template in categories.items()
+}
+_EMPTY_TEMPLATE: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]] = ((), (), ())
+
+
+def _flatten_patterns(groups: Dict[str, List[str]]) -> Tuple[List[str], _PatternSet]:
+    """Flatten {label: [patterns]} into a per-pattern label list and a matcher"""
+    labels: List[str] = []
+    patterns: List[str] = []
+    for label, group in groups.items():
+        labels.extend([label] * len(group))
+        patterns.extend(group)
+    return labels, _PatternSet(patterns)
+
+
+# Matchers used to scan descriptions and log entries in one pass each
+_ERROR_PATTERN_CATEGORIES, _ERROR_MATCHER = _flatten_patterns(
+    _TROUBLESHOOTING_PATTERNS["error_patterns"]
+)
+_SEVERITY_PATTERN_LEVELS, _SEVERITY_MATCHER = _flatten_patterns(
+    _TROUBLESHOOTING_PATTERNS["severity_indicators"]
+)
+
+
+class ConfigurationAgent:
+    """AI-powered configuration agent for automated troubleshooting"""
     
+    def __init__(self):
+        self.knowledge_base = _KNOWLEDGE_BASE
+        self.troubleshooting_patterns = _TROUBLESHOOTING_PATTERNS
+        self.solution_templates = _SOLUTION_TEMPLATES
+        self._compiled_templates = _COMPILED_TEMPLATES
+        self._error_pattern_categories = _ERROR_PATTERN_CATEGORIES
+        self._error_matcher = _ERROR_MATCHER
+        self._severity_pattern_levels = _SEVERITY_PATTERN_LEVELS
+        self._severity_matcher = _SEVERITY_MATCHER
+        
+        # (path, mtime_ns, size) -> analysis of an unchanged configuration file
+        self._config_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+        # plan inputs fingerprint -> previously generated (read-only) troubleshooting plan
+        self._plan_cache: "OrderedDict[Tuple[str, str, str, bool, bool], _FrozenDict]" = OrderedDict()
+        
     async def troubleshoot(self, issue_description: str, 
                           config_files: Optional[List[str]] = None,
                           error_logs: Optional[List[str]] = None,
@@ -224,11 +426,16 @@ class ConfigurationAgent:
             
             # Create comprehensive result
             result = {
-                "analysis_timestamp": datetime.now().isoformat(),
+                "analysis_timestamp": _now_iso(),
                 "issue_analysis": issue_analysis,
                 "configuration_analysis": config_analysis,
                 "log_analysis": log_analysis,
                 "troubleshooting_plan": troubleshooting_plan,
+                "flat_recommendations": list(chain(
+                    troubleshooting_plan.get("immediate_actions", []),
+                    troubleshooting_plan.get("investigation_steps", []),
+                    troubleshooting_plan.get("resolution_steps", [])
+                )),
                 "system_type": system_type,
                 "confidence_score": self._calculate_confidence_score(issue_analysis, config_analysis, log_analysis)
             }
@@ -254,14 +461,12 @@ class ConfigurationAgent:
             description_lower = description.lower()
             
             # Detect error patterns
-            for category, patterns in self.troubleshooting_patterns["error_patterns"].items():
-                for pattern in patterns:
-                    if re.search(pattern, description_lower, re.IGNORECASE):
-                        analysis["detected_patterns"].append({
-                            "category": category,
-                            "pattern": pattern,
-                            "matched_text": re.search(pattern, description_lower, re.IGNORECASE).group()
-                        })
+            for pattern_id, match in self._error_matcher.matches(description_lower):
+                analysis["detected_patterns"].append({
+                    "category": self._error_pattern_categories[pattern_id],
+                    "pattern": self._error_matcher.patterns[pattern_id],
+                    "matched_text": match.group()
+                })
             
             # Determine primary issue category
             if analysis["detected_patterns"]:
@@ -271,14 +476,14 @@ class ConfigurationAgent:
                     category_counts[category] = category_counts.get(category, 0) + 1
                 analysis["issue_category"] = max(category_counts, key=category_counts.get)
             
-            # Determine severity
-            for severity, indicators in self.troubleshooting_patterns["severity_indicators"].items():
-                for indicator in indicators:
-                    if re.search(indicator, description_lower, re.IGNORECASE):
-                        analysis["severity"] = severity
-                        break
-                if analysis["severity"] != "medium":
-                    break
+            # Determine severity: the most urgent level with any matching indicator
+            matched_levels = {
+                self._severity_pattern_levels[pattern_id]
+                for pattern_id in self._severity_matcher.matching_ids(description_lower)
+            }
+            analysis["severity"] = next(
+                (severity for severity in _SEVERITY_PRIORITY if severity in matched_levels), "medium"
+            )
             
             # Extract keywords
             analysis["keywords"] = self._extract_keywords(description)
@@ -408,7 +613,22 @@ class ConfigurationAgent:
             return analysis
     
     async def _analyze_single_config_file(self, file_path: Path) -> Dict[str, Any]:
-        """Analyze a single configuration file"""
+        """Analyze a single configuration file, reusing the result if unchanged"""
+        stat = file_path.stat()
+        cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            self._config_cache.move_to_end(cache_key)
+            return cached
+        
+        analysis = self._analyze_config_file_content(file_path)
+        self._config_cache[cache_key] = analysis
+        if len(self._config_cache) > _CONFIG_CACHE_MAX_ENTRIES:
+            self._config_cache.popitem(last=False)
+        return analysis
+    
+    def _analyze_config_file_content(self, file_path: Path) -> Dict[str, Any]:
+        """Parse and scan a configuration file for issues and security concerns"""
         analysis = {
             "file_path": str(file_path),
             "file_type": self._detect_config_type(file_path),
@@ -498,15 +718,8 @@ class ConfigurationAgent:
         issues = []
         
         # Check for hardcoded sensitive values
-        sensitive_patterns = [
-            (r'password\s*=\s*["\']?[^"\'\s]+', 'hardcoded_password'),
-            (r'api[_-]?key\s*=\s*["\']?[^"\'\s]+', 'hardcoded_api_key'),
-            (r'secret\s*=\s*["\']?[^"\'\s]+', 'hardcoded_secret'),
-            (r'token\s*=\s*["\']?[^"\'\s]+', 'hardcoded_token')
-        ]
-        
-        for pattern, issue_type in sensitive_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern, issue_type in _SENSITIVE_VALUE_PATTERNS:
+            matches = pattern.findall(content)
             if matches:
                 issues.append({
                     "type": issue_type,
@@ -537,10 +750,10 @@ class ConfigurationAgent:
                 "severity": "high"
             })
         
-        # Check for default ports
-        default_ports = ['3306', '5432', '1433', '27017', '6379']  # MySQL, PostgreSQL, SQL Server, MongoDB, Redis
-        for port in default_ports:
-            if port in content:
+        # Check for default ports (single pass, whole-number matches only)
+        found_ports = {m.group(1) for m in _DEFAULT_PORT_RE.finditer(content)}
+        for port in _DEFAULT_PORTS:
+            if port in found_ports:
                 concerns.append({
                     "type": "default_port",
                     "message": f"Using default port {port} - consider changing for security",
@@ -594,20 +807,20 @@ class ConfigurationAgent:
                 if not entry.strip():
                     continue
                 
-                # Check for error patterns
-                for category, patterns in self.troubleshooting_patterns["error_patterns"].items():
-                    for pattern in patterns:
-                        if re.search(pattern, entry, re.IGNORECASE):
-                            if category not in analysis["error_patterns"]:
-                                analysis["error_patterns"][category] = []
-                            analysis["error_patterns"][category].append(entry.strip())
+                # Check for error patterns (one entry per matching pattern)
+                for pattern_id in sorted(self._error_matcher.matching_ids(entry)):
+                    category = self._error_pattern_categories[pattern_id]
+                    if category not in analysis["error_patterns"]:
+                        analysis["error_patterns"][category] = []
+                    analysis["error_patterns"][category].append(entry.strip())
                 
-                # Check severity
-                for severity, indicators in self.troubleshooting_patterns["severity_indicators"].items():
-                    for indicator in indicators:
-                        if re.search(indicator, entry, re.IGNORECASE):
-                            analysis["severity_distribution"][severity] += 1
-                            break
+                # Check severity (each level counted at most once per entry)
+                matched_levels = {
+                    self._severity_pattern_levels[pattern_id]
+                    for pattern_id in self._severity_matcher.matching_ids(entry)
+                }
+                for severity in matched_levels:
+                    analysis["severity_distribution"][severity] += 1
             
             # Generate recommendations
             analysis["recommendations"] = self._generate_log_recommendations(analysis)
@@ -652,90 +865,77 @@ class ConfigurationAgent:
                                            log_analysis: Dict[str, Any],
                                            system_type: str) -> Dict[str, Any]:
         """Generate a comprehensive troubleshooting plan"""
-        plan = {
-            "immediate_actions": [],
-            "investigation_steps": [],
-            "resolution_steps": [],
-            "prevention_measures": [],
-            "estimated_complexity": "medium",
-            "estimated_time": "30-60 minutes"
-        }
-        
-        try:
-            issue_category = issue_analysis.get("issue_category", "unknown")
-            severity = issue_analysis.get("severity", "medium")
-            
-            # Get solution template if available
-            system_templates = self.solution_templates.get(system_type, {})
-            issue_template = system_templates.get(issue_category, {})
-            
-            # Add template-based actions
-            if issue_template:
-                plan["immediate_actions"].extend(issue_template.get("immediate", []))
-                plan["investigation_steps"].extend(issue_template.get("investigation", []))
-                plan["resolution_steps"].extend(issue_template.get("resolution", []))
-            
-            # Add severity-based urgency
-            if severity == "critical":
-                plan["immediate_actions"].insert(0, "CRITICAL: Escalate to senior technical staff immediately")
-                plan["estimated_complexity"] = "high"
-                plan["estimated_time"] = "1-4 hours"
-            elif severity == "high":
-                plan["immediate_actions"].insert(0, "High priority: Address within 1 hour")
-                plan["estimated_time"] = "1-2 hours"
-            
-            # Add configuration-specific steps
-            if config_analysis.get("configuration_issues"):
-                plan["investigation_steps"].append("Review configuration file issues identified")
-                plan["resolution_steps"].append("Fix configuration file problems")
-            
-            # Add log-specific steps
-            if log_analysis.get("error_patterns"):
-                plan["investigation_steps"].append("Analyze error log patterns for root cause")
-                plan["resolution_steps"].append("Address issues identified in error logs")
-            
-            # Add prevention measures
-            plan["prevention_measures"] = [
-                "Implement comprehensive monitoring and alerting",
-                "Regular system health checks and maintenance",
-                "Document configuration changes and procedures",
-                "Establish backup and recovery procedures",
-                "Conduct regular security and performance audits"
-            ]
-            
-            # Add diagnostic commands based on system type
-            if system_type in self.knowledge_base:
-                diagnostic_commands = self.knowledge_base[system_type].get("diagnostic_commands", {})
-                if diagnostic_commands:
-                    plan["diagnostic_commands"] = diagnostic_commands
-            
-            return plan
-            
-        except Exception as e:
-            logger.error(f"Error generating troubleshooting plan: {str(e)}")
-            return plan
+        # The plan depends only on these inputs, so repeated issues reuse it
+        cache_key = (
+            system_type,
+            issue_analysis.get("issue_category", "unknown"),
+            issue_analysis.get("severity", "medium"),
+            bool(config_analysis.get("configuration_issues")),
+            bool(log_analysis.get("error_patterns"))
+        )
+        cached_plan = self._plan_cache.get(cache_key)
+        if cached_plan is not None:
+            self._plan_cache.move_to_end(cache_key)
+            return cached_plan
+        
+        plan = _empty_plan()  # includes the shared prevention measures
+        
+        issue_category = issue_analysis.get("issue_category", "unknown")
+        severity = issue_analysis.get("severity", "medium")
+        
+        # Add template-based actions if a template is available
+        immediate, investigation, resolution = self._compiled_templates.get(
+            (system_type, issue_category), _EMPTY_TEMPLATE
+        )
+        plan["immediate_actions"].extend(immediate)
+        plan["investigation_steps"].extend(investigation)
+        plan["resolution_steps"].extend(resolution)
+        
+        # Add severity-based urgency
+        severity_adjustment = _SEVERITY_TABLE.get(severity)
+        if severity_adjustment:
+            urgent_action, complexity, estimated_time = severity_adjustment
+            plan["immediate_actions"] = [urgent_action, *plan["immediate_actions"]]
+            if complexity:
+                plan["estimated_complexity"] = complexity
+            plan["estimated_time"] = estimated_time
+        
+        # Add configuration-specific steps
+        if config_analysis.get("configuration_issues"):
+            plan["investigation_steps"].append("Review configuration file issues identified")
+            plan["resolution_steps"].append("Fix configuration file problems")
+        
+        # Add log-specific steps
+        if log_analysis.get("error_patterns"):
+            plan["investigation_steps"].append("Analyze error log patterns for root cause")
+            plan["resolution_steps"].append("Address issues identified in error logs")
+        
+        # Add diagnostic commands based on system type
+        if system_type in self.knowledge_base:
+            diagnostic_commands = self.knowledge_base[system_type].get("diagnostic_commands", {})
+            if diagnostic_commands:
+                plan["diagnostic_commands"] = diagnostic_commands
+        
+        # Frozen so the cached plan can be handed out by reference
+        plan = _FrozenDict(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in plan.items()
+        )
+        self._plan_cache[cache_key] = plan
+        if len(self._plan_cache) > _PLAN_CACHE_MAX_ENTRIES:
+            self._plan_cache.popitem(last=False)
+        
+        return plan
     
-    def _calculate_confidence_score(self, issue_analysis: Dict[str, Any],
-                                  config_analysis: Dict[str, Any],
-                                  log_analysis: Dict[str, Any]) -> float:
+    @staticmethod
+    def _calculate_confidence_score(issue_analysis: Dict[str, Any],
+                                    config_analysis: Dict[str, Any],
+                                    log_analysis: Dict[str, Any]) -> float:
         """Calculate confidence score for the troubleshooting analysis"""
-        try:
-            score = 0.5  # Base confidence
-            
-            # Increase confidence based on detected patterns
-            if issue_analysis.get("detected_patterns"):
-                score += 0.2
-            
-            # Increase confidence if we have configuration data
-            if config_analysis.get("files_analyzed"):
-                score += 0.15
-            
-            # Increase confidence if we have log data
-            if log_analysis.get("error_patterns"):
-                score += 0.15
-            
-            # Ensure score is between 0 and 1
-            return min(1.0, max(0.0, score))
-            
-        except Exception:
-            return 0.5  # Default confidence
\ No newline at end of file
+        # Base confidence plus weights for detected patterns, configuration
+        # data and log data; the terms are non-negative so only cap at 1
+        score = (0.5
+                 + 0.2 * bool(issue_analysis.get("detected_patterns"))
+                 + 0.15 * bool(config_analysis.get("files_analyzed"))
+                 + 0.15 * bool(log_analysis.get("error_patterns")))
+        return score if score <= 1.0 else 1.0
\ No newline at end of file
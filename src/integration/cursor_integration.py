@@ -3,37 +3,225 @@ Cursor AI Integration Layer for Configuration Research System
 """
 
 import asyncio
-import json
-from typing import Dict, List, Any, Optional, Callable
+import concurrent.futures
+import copy
+import hashlib
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from itertools import chain, filterfalse
+from operator import methodcaller
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Callable, Set, Tuple
 from pathlib import Path
 from loguru import logger
-from datetime import datetime
+import anyio.to_thread
+import orjson
 import websockets
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, Response, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 from ..mcp_server.server import MCPServer
-from ..agents.config_agent import ConfigurationAgent
+from ..agents.config_agent import ConfigurationAgent, _FrozenDict, _now_iso
 from ..processors.excel_processor import ExcelProcessor
 from ..processors.pdf_analyzer import PDFAnalyzer
 from ..validators.link_validator import LinkValidator
 from ..validators.config_validator import ConfigValidator
 
+# Optional faster event loop and HTTP parser for the server
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import httptools  # noqa: F401
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+
+# Workspace scans are reused for at most this long even if no change is seen.
+# Directory mtimes only move when entries are added, removed or renamed, so
+# an in-place edit shows up in a scan's size/modified fields within this window.
+_SCAN_CACHE_TTL_SECONDS = 30.0
+
+# orjson options for WebSocket payloads and MCP tool responses (numpy values
+# and non-string keys can appear in processor results)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Maximum number of cached /research results
+_RESULT_CACHE_MAX_ENTRIES = 512
+
+# Parameters naming input files whose state is part of a research cache key
+_FILE_PARAMETERS = ("file_path", "config_path", "excel_files", "pdf_files", "config_files")
+
+# Grouping of MCP tools reported by GET /tools
+_TOOL_CATEGORIES = {
+    "data_processing": ["process_excel_config", "analyze_error_pdf"],
+    "validation": ["validate_configuration_links", "configuration_validation"],
+    "troubleshooting": ["automated_troubleshooting"]
+}
+
+# Closing section of every comprehensive analysis recommendation list
+_GENERAL_RECOMMENDATIONS = (
+    "GENERAL RECOMMENDATIONS:",
+    "  • Implement automated monitoring for configuration changes",
+    "  • Regular security audits of configuration files",
+    "  • Maintain documentation for all configuration changes",
+    "  • Establish backup and recovery procedures"
+)
+
+# Per-file comprehensive analysis entries that failed carry an "error" key
+_has_error = methodcaller("get", "error")
+
+# Research task types that are queued and answered with 202 Accepted
+_BACKGROUND_TASK_TYPES = frozenset({"comprehensive_analysis"})
+
+# Maximum number of background tasks kept for status polling
+_ACTIVE_TASKS_MAX_ENTRIES = 10_000
+
+# Uploads are copied to disk in chunks of this many bytes
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Upper bound on threads for blocking calls made from request handlers
+# (the stdlib default formula, capped at 8 instead of 32)
+_THREAD_POOL_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Responses smaller than this many bytes are sent uncompressed
+_GZIP_MINIMUM_SIZE = 1024
+
+# WebSocket broadcasts are sent to this many clients at a time
+_BROADCAST_BATCH_SIZE = 50
+
+# File extensions picked up by the workspace scan
+EXCEL_EXTENSIONS = frozenset({'.xlsx', '.xls', '.xlsm'})
+PDF_EXTENSIONS = frozenset({'.pdf'})
+CONFIG_EXTENSIONS = frozenset({'.json', '.yaml', '.yml', '.xml', '.ini', '.conf', '.cfg', '.properties'})
+
+# Lower-case extension -> workspace scan result bucket
+EXT_CATEGORY = {
+    **dict.fromkeys(EXCEL_EXTENSIONS, "excel_files"),
+    **dict.fromkeys(PDF_EXTENSIONS, "pdf_files"),
+    **dict.fromkeys(CONFIG_EXTENSIONS, "config_files"),
+}
+
+
+def _iter_files(root: Path, visited: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+    """Yield every regular file below root in a single directory walk.
+    
+    Each directory that was actually listed is appended to visited, if given.
+    """
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                if visited is not None:
+                    visited.append(directory)
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {str(e)}")
+
+
+class _LazyProcessPool(concurrent.futures.Executor):
+    """Process pool that is only started when the first task is submitted"""
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._closed = False
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self._max_workers)
+            pool = self._pool
+        return pool.submit(fn, *args, **kwargs)
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._closed = True
+            pool = self._pool
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a JSON-like result: dicts become _FrozenDicts, lists tuples"""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Bound the worker threads used by sync code and asyncio.to_thread.
+    
+    CPU-heavy parsing runs in the process pool instead.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=_THREAD_POOL_MAX_WORKERS)
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _THREAD_POOL_MAX_WORKERS
+    yield
+
+
+# One processor per worker process, so its result cache survives between tasks
+_worker_excel_processor: Optional[ExcelProcessor] = None
+
+
+def _excel_worker(file_path: str, sheet_name: Optional[str] = None,
+                  config_type: str = "general", deep_scan: bool = False) -> Dict[str, Any]:
+    """Process an Excel file in a worker process"""
+    global _worker_excel_processor
+    if _worker_excel_processor is None:
+        _worker_excel_processor = ExcelProcessor()
+    return asyncio.run(_worker_excel_processor.process_file(file_path, sheet_name, config_type, deep_scan))
+
+
+def _pdf_worker(file_path: str, error_type: Optional[str] = None,
+                extract_solutions: bool = True) -> Dict[str, Any]:
+    """Analyze a PDF document in a worker process"""
+    return asyncio.run(PDFAnalyzer().analyze_document(file_path, error_type, extract_solutions))
+
 
 class ConfigResearchRequest(BaseModel):
     """Request model for configuration research"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     task_type: str
-    parameters: Dict[str, Any]
+    parameters: dict
     priority: str = "normal"
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[dict] = None
 
 
 class ConfigResearchResponse(BaseModel):
     """Response model for configuration research"""
+    model_config = ConfigDict(frozen=True)
+    
     task_id: str
     status: str
-    result: Dict[str, Any]
+    result: dict
     timestamp: str
     processing_time: float
 
@@ -43,19 +231,43 @@ class CursorIntegration:
     
     def __init__(self, workspace_path: str = "/workspace"):
         self.workspace_path = Path(workspace_path)
-        self.mcp_server = MCPServer(str(workspace_path))
+        
+        # Excel and PDF parsing is CPU-bound, so it runs in worker processes
+        # instead of blocking the event loop. The one pool is shared with the
+        # MCP server and owned here; see shutdown().
+        self._cpu_pool = _LazyProcessPool(max_workers=os.cpu_count())
+        
+        self.mcp_server = MCPServer(str(workspace_path), executor=self._cpu_pool)
         self.config_agent = ConfigurationAgent()
-        self.excel_processor = ExcelProcessor()
+        self.excel_processor = ExcelProcessor(executor=self._cpu_pool)
         self.pdf_analyzer = PDFAnalyzer()
         self.link_validator = LinkValidator()
         self.config_validator = ConfigValidator()
         
-        # Task management
-        self.active_tasks = {}
-        self.task_counter = 0
+        # The tool set is fixed for the life of the process, so the tool names
+        # and the serialized /tools response are built once
+        self._tool_names = [tool.name for tool in self.mcp_server.tools]
+        self._tools_response_body = orjson.dumps({
+            "tools": self.mcp_server.get_available_tools(),
+            "categories": _TOOL_CATEGORIES
+        })
         
-        # WebSocket connections for real-time updates
+        # Task management; background tasks are tracked by id for polling,
+        # keeping only the most recently submitted ones
+        self.active_tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._background_jobs: Set[asyncio.Task] = set()
+        
+        # Research cache key -> result of an identical request on unchanged files
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # WebSocket connections for real-time updates, fed by a single
+        # background broadcaster that coalesces bursts of queued updates
         self.websocket_connections = set()
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+        
+        # Workspace root -> (scanned directories, their mtimes, monotonic time of scan, scan result)
+        self._scan_cache: Dict[Path, Tuple[List[str], Tuple[float, ...], float, Dict[str, Any]]] = {}
         
         # Initialize FastAPI app
         self.app = self._create_fastapi_app()
@@ -67,7 +279,9 @@ class CursorIntegration:
         app = FastAPI(
             title="Agentic Configuration Research API",
             description="AI-powered configuration research and troubleshooting system",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse,
+            lifespan=_lifespan
         )
         
         # Add CORS middleware
@@ -79,6 +293,9 @@ class CursorIntegration:
             allow_headers=["*"],
         )
         
+        # Compress larger JSON bodies (comprehensive results repeat many keys)
+        app.add_middleware(GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE)
+        
         # Add routes
         self._add_routes(app)
         
@@ -93,46 +310,44 @@ class CursorIntegration:
                 "message": "Agentic Configuration Research API",
                 "version": "1.0.0",
                 "status": "active",
-                "available_tools": [tool.name for tool in self.mcp_server.tools]
+                "available_tools": self._tool_names
             }
         
         @app.post("/research", response_model=ConfigResearchResponse)
-        async def perform_research(request: ConfigResearchRequest):
+        async def perform_research(request: ConfigResearchRequest, http_response: Response):
             """Perform configuration research task"""
             try:
-                task_id = f"task_{self.task_counter}"
-                self.task_counter += 1
+                task_id = f"task_{uuid.uuid4().hex[:16]}"
+                
+                # Long-running tasks are accepted immediately and finish in the
+                # background; clients poll /research/{task_id} or listen on /ws
+                if request.task_type in _BACKGROUND_TASK_TYPES:
+                    self._submit_background_task(task_id, request.task_type, request.parameters)
+                    http_response.status_code = 202
+                    return ConfigResearchResponse(
+                        task_id=task_id,
+                        status="queued",
+                        result={},
+                        timestamp=_now_iso(),
+                        processing_time=0.0
+                    )
                 
-                start_time = datetime.now()
+                start_time = time.perf_counter()
                 
-                # Route to appropriate handler based on task type
-                if request.task_type == "excel_analysis":
-                    result = await self._handle_excel_analysis(request.parameters)
-                elif request.task_type == "pdf_analysis":
-                    result = await self._handle_pdf_analysis(request.parameters)
-                elif request.task_type == "link_validation":
-                    result = await self._handle_link_validation(request.parameters)
-                elif request.task_type == "config_validation":
-                    result = await self._handle_config_validation(request.parameters)
-                elif request.task_type == "troubleshooting":
-                    result = await self._handle_troubleshooting(request.parameters)
-                elif request.task_type == "comprehensive_analysis":
-                    result = await self._handle_comprehensive_analysis(request.parameters)
-                else:
-                    raise HTTPException(status_code=400, detail=f"Unknown task type: {request.task_type}")
+                result = await self._run_cached_research(request.task_type, request.parameters)
                 
-                processing_time = (datetime.now() - start_time).total_seconds()
+                processing_time = time.perf_counter() - start_time
                 
                 response = ConfigResearchResponse(
                     task_id=task_id,
                     status="completed",
                     result=result,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=_now_iso(),
                     processing_time=processing_time
                 )
                 
                 # Send real-time update via WebSocket
-                await self._broadcast_update({
+                self._broadcast_update({
                     "type": "task_completed",
                     "task_id": task_id,
                     "result": result
@@ -144,19 +359,25 @@ class CursorIntegration:
                 logger.error(f"Error processing research request: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
         
+        @app.get("/research/{task_id}")
+        async def get_research_status(task_id: str):
+            """Get the status of a background research task"""
+            task = self.active_tasks.get(task_id)
+            if task is None:
+                raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+            
+            return {"task_id": task_id, **task}
+        
         @app.post("/upload/excel")
         async def upload_excel(file: UploadFile = File(...)):
             """Upload and analyze Excel file"""
             try:
                 # Save uploaded file
                 upload_path = self.workspace_path / "data" / "excel" / file.filename
-                upload_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                content = await file.read()
-                upload_path.write_bytes(content)
+                await self._save_upload(file, upload_path)
                 
                 # Analyze the file
-                result = await self.excel_processor.process_file(str(upload_path))
+                result = await self._process_excel(str(upload_path))
                 
                 return {
                     "message": "Excel file uploaded and analyzed successfully",
@@ -174,13 +395,10 @@ class CursorIntegration:
             try:
                 # Save uploaded file
                 upload_path = self.workspace_path / "data" / "pdfs" / file.filename
-                upload_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                content = await file.read()
-                upload_path.write_bytes(content)
+                await self._save_upload(file, upload_path)
                 
                 # Analyze the file
-                result = await self.pdf_analyzer.analyze_document(str(upload_path))
+                result = await self._analyze_pdf(str(upload_path))
                 
                 return {
                     "message": "PDF file uploaded and analyzed successfully",
@@ -195,25 +413,23 @@ class CursorIntegration:
         @app.get("/tools")
         async def get_available_tools():
             """Get list of available MCP tools"""
-            return {
-                "tools": self.mcp_server.get_available_tools(),
-                "categories": {
-                    "data_processing": ["process_excel_config", "analyze_error_pdf"],
-                    "validation": ["validate_configuration_links", "configuration_validation"],
-                    "troubleshooting": ["automated_troubleshooting"]
-                }
-            }
+            return Response(self._tools_response_body, media_type="application/json")
         
         @app.post("/tools/{tool_name}")
         async def execute_tool(tool_name: str, parameters: Dict[str, Any]):
             """Execute specific MCP tool"""
             try:
                 result = await self.mcp_server.handle_tool_call(tool_name, parameters)
-                return {
-                    "tool": tool_name,
-                    "result": result,
-                    "timestamp": datetime.now().isoformat()
-                }
+                # Encoded directly with orjson: tool results are large nested dicts and
+                # FastAPI's jsonable_encoder pass would walk them in Python first
+                return Response(
+                    orjson.dumps(
+                        {"tool": tool_name, "result": result, "timestamp": _now_iso()},
+                        default=str,
+                        option=_ORJSON_OPTIONS
+                    ),
+                    media_type="application/json"
+                )
             except Exception as e:
                 logger.error(f"Error executing tool {tool_name}: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -242,16 +458,155 @@ class CursorIntegration:
             finally:
                 self.websocket_connections.discard(websocket)
     
+    async def _save_upload(self, file: UploadFile, upload_path: Path):
+        """Stream an uploaded file to disk without holding it all in memory"""
+        upload_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with upload_path.open("wb") as out:
+            while True:
+                chunk = await file.read(_UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                await asyncio.to_thread(out.write, chunk)
+    
+    async def _run_research_task(self, task_type: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Route a research task to the appropriate handler based on task type"""
+        if task_type == "excel_analysis":
+            return await self._handle_excel_analysis(parameters)
+        elif task_type == "pdf_analysis":
+            return await self._handle_pdf_analysis(parameters)
+        elif task_type == "link_validation":
+            return await self._handle_link_validation(parameters)
+        elif task_type == "config_validation":
+            return await self._handle_config_validation(parameters)
+        elif task_type == "troubleshooting":
+            return await self._handle_troubleshooting(parameters)
+        elif task_type == "comprehensive_analysis":
+            return await self._handle_comprehensive_analysis(parameters)
+        else:
+            raise HTTPException(status_code=400, detail=f"Unknown task type: {task_type}")
+    
+    async def _run_cached_research(self, task_type: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a research task, reusing the result of an identical request on unchanged files.
+        
+        Cacheable results are frozen before they are stored, because the same
+        object is then embedded in every response, task record and WebSocket
+        update that reuses it. Their timestamps record when the analysis ran.
+        """
+        cache_key = self._research_cache_key(task_type, parameters)
+        result = self._result_cache.get(cache_key) if cache_key else None
+        if result is not None:
+            self._result_cache.move_to_end(cache_key)
+            return result
+        
+        result = await self._run_research_task(task_type, parameters)
+        if cache_key:
+            result = _freeze(result)
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+        return result
+    
+    def _submit_background_task(self, task_id: str, task_type: str, parameters: Dict[str, Any]):
+        """Record a queued research task and start running it in the background"""
+        task = {
+            "task_type": task_type,
+            "status": "queued",
+            "submitted_at": _now_iso()
+        }
+        self.active_tasks[task_id] = task
+        if len(self.active_tasks) > _ACTIVE_TASKS_MAX_ENTRIES:
+            self.active_tasks.popitem(last=False)
+        
+        job = asyncio.create_task(self._run_background_task(task, task_id, task_type, parameters))
+        self._background_jobs.add(job)
+        job.add_done_callback(self._background_jobs.discard)
+    
+    async def _run_background_task(self, task: Dict[str, Any], task_id: str,
+                                   task_type: str, parameters: Dict[str, Any]):
+        """Run a queued research task, recording its outcome and broadcasting it"""
+        task["status"] = "running"
+        start_time = time.perf_counter()
+        
+        try:
+            result = await self._run_cached_research(task_type, parameters)
+        except Exception as e:
+            logger.error(f"Error processing background task {task_id}: {str(e)}")
+            task.update(status="failed", error=str(e),
+                        processing_time=time.perf_counter() - start_time)
+            self._broadcast_update({
+                "type": "task_failed",
+                "task_id": task_id,
+                "error": str(e)
+            })
+            return
+        
+        task.update(status="completed", result=result,
+                    processing_time=time.perf_counter() - start_time)
+        self._broadcast_update({
+            "type": "task_completed",
+            "task_id": task_id,
+            "result": result
+        })
+    
+    def _research_cache_key(self, task_type: str, parameters: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a research request, or None if its result must not be reused.
+        
+        The key covers the task type, the canonical parameters and the
+        (mtime, size) of every referenced input file, so editing a file
+        naturally misses the cache. Link checks depend on remote state and
+        are never cached.
+        """
+        if task_type == "link_validation" or parameters.get("links"):
+            return None
+        
+        file_states = {}
+        for name in _FILE_PARAMETERS:
+            value = parameters.get(name)
+            paths = value if isinstance(value, list) else [value] if value else []
+            for path in paths:
+                if not isinstance(path, str):
+                    continue
+                try:
+                    stat = os.stat(path)
+                    file_states[path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    file_states[path] = None
+        
+        try:
+            canonical = orjson.dumps(
+                {"t": task_type, "p": parameters, "files": file_states},
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    
+    async def _process_excel(self, file_path: str, sheet_name: Optional[str] = None,
+                             config_type: str = "general", deep_scan: bool = False) -> Dict[str, Any]:
+        """Process an Excel file in the CPU worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._cpu_pool, _excel_worker, file_path, sheet_name, config_type, deep_scan
+        )
+    
+    async def _analyze_pdf(self, file_path: str, error_type: Optional[str] = None,
+                           extract_solutions: bool = True) -> Dict[str, Any]:
+        """Analyze a PDF document in the CPU worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, _pdf_worker, file_path, error_type, extract_solutions)
+    
     async def _handle_excel_analysis(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Handle Excel file analysis"""
         file_path = parameters.get("file_path")
         sheet_name = parameters.get("sheet_name")
         config_type = parameters.get("config_type", "general")
+        deep_scan = bool(parameters.get("deep_scan", False))
         
         if not file_path:
             raise ValueError("file_path parameter is required")
         
-        result = await self.excel_processor.process_file(file_path, sheet_name, config_type)
+        result = await self._process_excel(file_path, sheet_name, config_type, deep_scan)
         
         return {
             "type": "excel_analysis",
@@ -269,7 +624,7 @@ class CursorIntegration:
         if not file_path:
             raise ValueError("file_path parameter is required")
         
-        result = await self.pdf_analyzer.analyze_document(file_path, error_type, extract_solutions)
+        result = await self._analyze_pdf(file_path, error_type, extract_solutions)
         
         return {
             "type": "pdf_analysis",
@@ -346,84 +701,94 @@ class CursorIntegration:
         links = parameters.get("links", [])
         issue_description = parameters.get("issue_description")
         
+        # The resource groups are independent, so process them all concurrently
+        (excel_analysis, pdf_analysis, config_validation,
+         link_validation, troubleshooting) = await asyncio.gather(
+            self._gather_file_results(excel_files, self._process_excel, "analysis"),
+            self._gather_file_results(pdf_files, self._analyze_pdf, "analysis"),
+            self._gather_file_results(config_files, self.config_validator.validate_config, "validation"),
+            self._comprehensive_link_validation(links),
+            self._comprehensive_troubleshooting(issue_description, config_files)
+        )
+        
         results = {
-            "excel_analysis": [],
-            "pdf_analysis": [],
-            "config_validation": [],
-            "link_validation": None,
-            "troubleshooting": None
+            "excel_analysis": excel_analysis,
+            "pdf_analysis": pdf_analysis,
+            "config_validation": config_validation,
+            "link_validation": link_validation,
+            "troubleshooting": troubleshooting
         }
         
-        # Process Excel files
-        for excel_file in excel_files:
-            try:
-                analysis = await self.excel_processor.process_file(excel_file)
-                results["excel_analysis"].append({
-                    "file": excel_file,
-                    "analysis": analysis
-                })
-            except Exception as e:
-                results["excel_analysis"].append({
-                    "file": excel_file,
-                    "error": str(e)
-                })
-        
-        # Process PDF files
-        for pdf_file in pdf_files:
-            try:
-                analysis = await self.pdf_analyzer.analyze_document(pdf_file)
-                results["pdf_analysis"].append({
-                    "file": pdf_file,
-                    "analysis": analysis
-                })
-            except Exception as e:
-                results["pdf_analysis"].append({
-                    "file": pdf_file,
-                    "error": str(e)
-                })
-        
-        # Validate configuration files
-        for config_file in config_files:
-            try:
-                validation = await self.config_validator.validate_config(config_file)
-                results["config_validation"].append({
-                    "file": config_file,
-                    "validation": validation
-                })
-            except Exception as e:
-                results["config_validation"].append({
-                    "file": config_file,
-                    "error": str(e)
-                })
-        
-        # Validate links
-        if links:
-            try:
-                async with LinkValidator() as validator:
-                    results["link_validation"] = await validator.validate_links(links)
-            except Exception as e:
-                results["link_validation"] = {"error": str(e)}
-        
-        # Perform troubleshooting if issue description provided
-        if issue_description:
-            try:
-                results["troubleshooting"] = await self.config_agent.troubleshoot(
-                    issue_description, config_files, []
-                )
-            except Exception as e:
-                results["troubleshooting"] = {"error": str(e)}
-        
-        # Generate comprehensive recommendations
-        recommendations = self._generate_comprehensive_recommendations(results)
+        # Generate comprehensive recommendations and summary
+        recommendations, summary = self._generate_comprehensive_report(results)
         
         return {
             "type": "comprehensive_analysis",
             "results": results,
             "recommendations": recommendations,
-            "summary": self._generate_comprehensive_summary(results)
+            "summary": summary
         }
     
+    async def _gather_file_results(self, files: List[str], operation: Callable,
+                                   result_key: str) -> List[Dict[str, Any]]:
+        """Run an analysis coroutine on every file concurrently, recording per-file errors"""
+        outcomes = await asyncio.gather(*(operation(file) for file in files), return_exceptions=True)
+        
+        return [
+            {"file": file, "error": str(outcome)} if isinstance(outcome, Exception)
+            else {"file": file, result_key: outcome}
+            for file, outcome in zip(files, outcomes)
+        ]
+    
+    async def _comprehensive_link_validation(self, links: List[str]) -> Optional[Dict[str, Any]]:
+        """Validate links for a comprehensive analysis, if any were given"""
+        if not links:
+            return None
+        
+        try:
+            async with LinkValidator() as validator:
+                return await validator.validate_links(links)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    async def _comprehensive_troubleshooting(self, issue_description: Optional[str],
+                                             config_files: List[str]) -> Optional[Dict[str, Any]]:
+        """Troubleshoot the described issue for a comprehensive analysis, if any"""
+        if not issue_description:
+            return None
+        
+        try:
+            return await self.config_agent.troubleshoot(issue_description, config_files, [])
+        except Exception as e:
+            return {"error": str(e)}
+    
+    @staticmethod
+    def _directory_mtimes(directories: List[str]) -> Optional[Tuple[float, ...]]:
+        """mtimes of the given directories, or None if any of them is gone"""
+        try:
+            return tuple(os.stat(directory).st_mtime for directory in directories)
+        except OSError:
+            return None
+    
     async def _scan_workspace(self) -> Dict[str, Any]:
+        """Scan workspace for configuration files, reusing a recent unchanged scan"""
+        cached = self._scan_cache.get(self.workspace_path)
+        if cached is not None:
+            directories, cached_mtimes, cached_at, cached_result = cached
+            if (time.monotonic() - cached_at < _SCAN_CACHE_TTL_SECONDS
+                    and self._directory_mtimes(directories) == cached_mtimes):
+                return copy.deepcopy(cached_result)
+        
+        directories: List[str] = []
+        scan_result = await self._scan_workspace_files(directories)
+        mtimes = self._directory_mtimes(directories)
+        if directories and mtimes is not None:
+            self._scan_cache[self.workspace_path] = (
+                directories, mtimes, time.monotonic(), copy.deepcopy(scan_result)
+            )
+        return scan_result
+    
+    async def _scan_workspace_files(self, visited: Optional[List[str]] = None) -> Dict[str, Any]:
         """Scan workspace for configuration files and resources"""
         scan_result = {
             "excel_files": [],
@@ -431,38 +796,24 @@ class CursorIntegration:
             "config_files": [],
             "other_files": [],
             "total_files": 0,
-            "scan_timestamp": datetime.now().isoformat()
+            "scan_timestamp": _now_iso()
         }
         
         try:
-            # Scan for Excel files
-            excel_patterns = ["*.xlsx", "*.xls", "*.xlsm"]
-            for pattern in excel_patterns:
-                for file_path in self.workspace_path.rglob(pattern):
-                    scan_result["excel_files"].append({
-                        "path": str(file_path),
-                        "size": file_path.stat().st_size,
-                        "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                    })
-            
-            # Scan for PDF files
-            for file_path in self.workspace_path.rglob("*.pdf"):
-                scan_result["pdf_files"].append({
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                })
-            
-            # Scan for configuration files
-            config_patterns = ["*.json", "*.yaml", "*.yml", "*.xml", "*.ini", "*.conf", "*.cfg", "*.properties"]
-            for pattern in config_patterns:
-                for file_path in self.workspace_path.rglob(pattern):
-                    scan_result["config_files"].append({
-                        "path": str(file_path),
-                        "type": file_path.suffix.lstrip('.'),
-                        "size": file_path.stat().st_size,
-                        "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                    })
+            # Classify every file by extension in one walk of the tree
+            for entry in _iter_files(self.workspace_path, visited):
+                suffix = os.path.splitext(entry.name)[1]
+                category = EXT_CATEGORY.get(suffix.lower())
+                if category is None:
+                    continue
+                
+                stat = entry.stat()
+                file_info = {"path": entry.path}
+                if category == "config_files":
+                    file_info["type"] = suffix.lstrip('.')
+                file_info["size"] = stat.st_size
+                file_info["modified"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(stat.st_mtime))
+                scan_result[category].append(file_info)
             
             # Calculate totals
             scan_result["total_files"] = (
@@ -495,14 +846,7 @@ class CursorIntegration:
     
     def _generate_pdf_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on PDF analysis"""
-        recommendations = analysis.get("recommendations", {})
-        
-        all_recommendations = []
-        all_recommendations.extend(recommendations.get("immediate_actions", []))
-        all_recommendations.extend(recommendations.get("investigation_steps", []))
-        all_recommendations.extend(recommendations.get("preventive_measures", []))
-        
-        return all_recommendations
+        return analysis.get("flat_recommendations", [])
     
     def _generate_config_recommendations(self, validation: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on configuration validation"""
@@ -513,63 +857,75 @@ class CursorIntegration:
     
     def _generate_troubleshooting_recommendations(self, result: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on troubleshooting result"""
-        plan = result.get("troubleshooting_plan", {})
-        
-        recommendations = []
-        recommendations.extend(plan.get("immediate_actions", []))
-        recommendations.extend(plan.get("investigation_steps", []))
-        recommendations.extend(plan.get("resolution_steps", []))
-        
-        return recommendations
+        return result.get("flat_recommendations", [])
     
-    def _generate_comprehensive_recommendations(self, results: Dict[str, Any]) -> List[str]:
-        """Generate comprehensive recommendations from all analyses"""
-        recommendations = []
+    def _generate_comprehensive_report(self, results: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+        """Generate comprehensive recommendations and summary in one pass over all analyses"""
+        excel_results = results.get("excel_analysis", [])
+        pdf_results = results.get("pdf_analysis", [])
+        config_results = results.get("config_validation", [])
+        
+        summary = {
+            "files_processed": {
+                "excel": len(excel_results),
+                "pdf": len(pdf_results),
+                "config": len(config_results)
+            },
+            "issues_found": {
+                "critical": 0,
+                "high": 0,
+                "medium": 0,
+                "low": 0
+            },
+            "overall_health_score": 100,
+            "key_findings": [],
+            "next_steps": []
+        }
         
         # Priority-based recommendations
         high_priority = []
         medium_priority = []
-        low_priority = []
         
         # Analyze results and categorize recommendations
-        if results.get("troubleshooting") and not results["troubleshooting"].get("error"):
-            plan = results["troubleshooting"].get("troubleshooting_plan", {})
+        troubleshooting = results.get("troubleshooting")
+        if troubleshooting and not troubleshooting.get("error"):
+            plan = troubleshooting.get("troubleshooting_plan", {})
             high_priority.extend(plan.get("immediate_actions", []))
             medium_priority.extend(plan.get("investigation_steps", []))
         
-        # Add Excel-specific recommendations
-        for excel_result in results.get("excel_analysis", []):
-            if not excel_result.get("error"):
-                analysis = excel_result.get("analysis", {})
-                validation_results = analysis.get("validation_results", {})
-                for sheet_results in validation_results.values():
-                    if sheet_results.get("security_issues"):
-                        high_priority.append("Critical: Address security issues in Excel configurations")
+        # Excel security issues feed both the recommendations and the summary
+        for excel_result in filterfalse(_has_error, excel_results):
+            validation_results = excel_result.get("analysis", {}).get("validation_results", {})
+            for sheet_results in validation_results.values():
+                security_issues = sheet_results.get("security_issues")
+                if security_issues:
+                    high_priority.append("Critical: Address security issues in Excel configurations")
+                    summary["issues_found"]["critical"] += len(security_issues)
+                    summary["overall_health_score"] -= 10
         
         # Add PDF-specific recommendations
-        for pdf_result in results.get("pdf_analysis", []):
-            if not pdf_result.get("error"):
-                analysis = pdf_result.get("analysis", {})
-                pdf_recommendations = analysis.get("recommendations", {})
-                high_priority.extend(pdf_recommendations.get("immediate_actions", []))
+        high_priority.extend(chain.from_iterable(
+            pdf_result.get("analysis", {}).get("recommendations", {}).get("immediate_actions", [])
+            for pdf_result in filterfalse(_has_error, pdf_results)
+        ))
         
         # Add configuration validation recommendations
-        for config_result in results.get("config_validation", []):
-            if not config_result.get("error"):
-                validation = config_result.get("validation", {})
-                if isinstance(validation, dict) and "summary" in validation:
-                    summary = validation["summary"]
-                    if summary.get("overall_status") == "failed":
-                        high_priority.append("Critical: Fix configuration validation errors")
-                    elif summary.get("total_warnings", 0) > 0:
-                        medium_priority.append("Review configuration warnings")
+        for config_result in filterfalse(_has_error, config_results):
+            validation = config_result.get("validation", {})
+            if isinstance(validation, dict) and "summary" in validation:
+                validation_summary = validation["summary"]
+                if validation_summary.get("overall_status") == "failed":
+                    high_priority.append("Critical: Fix configuration validation errors")
+                elif validation_summary.get("total_warnings", 0) > 0:
+                    medium_priority.append("Review configuration warnings")
         
         # Add link validation recommendations
-        if results.get("link_validation") and not results["link_validation"].get("error"):
-            link_recommendations = results["link_validation"].get("recommendations", [])
-            medium_priority.extend(link_recommendations)
+        link_validation = results.get("link_validation")
+        if link_validation and not link_validation.get("error"):
+            medium_priority.extend(link_validation.get("recommendations", []))
         
         # Combine and prioritize
+        recommendations = []
         if high_priority:
             recommendations.append("HIGH PRIORITY ACTIONS:")
             recommendations.extend([f"  • {rec}" for rec in high_priority[:5]])  # Top 5
@@ -579,44 +935,7 @@ class CursorIntegration:
             recommendations.extend([f"  • {rec}" for rec in medium_priority[:5]])  # Top 5
         
         # Add general recommendations
-        recommendations.extend([
-            "GENERAL RECOMMENDATIONS:",
-            "  • Implement automated monitoring for configuration changes",
-            "  • Regular security audits of configuration files",
-            "  • Maintain documentation for all configuration changes",
-            "  • Establish backup and recovery procedures"
-        ])
-        
-        return recommendations
-    
-    def _generate_comprehensive_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate comprehensive summary of all analyses"""
-        summary = {
-            "files_processed": {
-                "excel": len(results.get("excel_analysis", [])),
-                "pdf": len(results.get("pdf_analysis", [])),
-                "config": len(results.get("config_validation", []))
-            },
-            "issues_found": {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0
-            },
-            "overall_health_score": 100,
-            "key_findings": [],
-            "next_steps": []
-        }
-        
-        # Analyze results for issues
-        for excel_result in results.get("excel_analysis", []):
-            if not excel_result.get("error"):
-                analysis = excel_result.get("analysis", {})
-                validation_results = analysis.get("validation_results", {})
-                for sheet_results in validation_results.values():
-                    if sheet_results.get("security_issues"):
-                        summary["issues_found"]["critical"] += len(sheet_results["security_issues"])
-                        summary["overall_health_score"] -= 10
+        recommendations.extend(_GENERAL_RECOMMENDATIONS)
         
         # Add key findings
         if summary["issues_found"]["critical"] > 0:
@@ -632,21 +951,65 @@ class CursorIntegration:
         # Ensure health score doesn't go below 0
         summary["overall_health_score"] = max(0, summary["overall_health_score"])
         
-        return summary
+        return recommendations, summary
     
-    async def _broadcast_update(self, message: Dict[str, Any]):
-        """Broadcast update to all WebSocket connections"""
-        if self.websocket_connections:
-            disconnected = set()
-            for websocket in self.websocket_connections:
+    def _broadcast_update(self, message: Dict[str, Any]):
+        """Queue an update for broadcast to all WebSocket connections"""
+        if not self.websocket_connections:
+            return
+        
+        if self._broadcast_queue is None:
+            self._broadcast_queue = asyncio.Queue()
+        if self._broadcast_task is None or self._broadcast_task.done():
+            self._broadcast_task = asyncio.get_running_loop().create_task(self._run_broadcaster())
+        
+        self._broadcast_queue.put_nowait(message)
+    
+    async def _run_broadcaster(self):
+        """Drain queued updates, sending each burst to every client as one frame"""
+        while True:
+            events = [await self._broadcast_queue.get()]
+            while True:
                 try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send WebSocket message: {str(e)}")
-                    disconnected.add(websocket)
+                    events.append(self._broadcast_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            # A lone update is sent as-is; a burst becomes one batch frame
+            message = events[0] if len(events) == 1 else {"type": "batch", "events": events}
+            try:
+                await self._send_to_all(message)
+            except Exception as e:
+                logger.error(f"Error broadcasting WebSocket update: {str(e)}")
+    
+    async def _send_to_all(self, message: Dict[str, Any]):
+        """Send a message to all WebSocket connections, pruning dead ones"""
+        if not self.websocket_connections:
+            return
+        
+        # Serialize once for every client; sent as a text frame like send_json
+        payload = orjson.dumps(message, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        
+        # Work from one snapshot; clients may connect or drop while sending
+        connections = tuple(self.websocket_connections)
+        disconnected = set()
+        for start in range(0, len(connections), _BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + _BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(websocket.send_text(payload) for websocket in batch), return_exceptions=True
+            )
+            disconnected.update(
+                websocket for websocket, result in zip(batch, results) if isinstance(result, Exception)
+            )
             
-            # Remove disconnected websockets
-            self.websocket_connections -= disconnected
+            # Let other tasks run between batches of a large broadcast
+            if start + _BROADCAST_BATCH_SIZE < len(connections):
+                await asyncio.sleep(0)
+        
+        # Remove disconnected websockets in one step
+        if disconnected:
+            logger.warning(f"Failed to send WebSocket message to {len(disconnected)} client(s); dropping them")
+            self.websocket_connections.difference_update(disconnected)
     
     async def start_server(self, host: str = "0.0.0.0", port: int = 8000):
         """Start the FastAPI server"""
@@ -654,16 +1017,28 @@ class CursorIntegration:
         
         logger.info(f"Starting Cursor AI Integration server on {host}:{port}")
         
+        # The loop setting only applies when uvicorn creates the event loop;
+        # main.py installs the uvloop policy before starting asyncio
         config = uvicorn.Config(
             self.app,
             host=host,
             port=port,
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+            ws="websockets",
             log_level="info",
             access_log=True
         )
         
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """Stop the worker processes shared with the MCP server, if any were started"""
+        self._cpu_pool.shutdown(cancel_futures=True)
 
 
 # Utility functions for initialization
@@ -4,7 +4,9 @@ Provides tools for Excel processing, PDF analysis, and link validation
 """
 
 import json
+import os
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from loguru import logger
@@ -18,6 +20,7 @@ import validators
 from ..processors.excel_processor import ExcelProcessor
 from ..processors.pdf_analyzer import PDFAnalyzer
 from ..validators.link_validator import LinkValidator
+from ..validators.config_validator import ConfigValidator
 from ..agents.config_agent import ConfigurationAgent
 
 
@@ -30,15 +33,31 @@ class MCPTool(BaseModel):
 class MCPServer:
     """MCP Server for configuration research and troubleshooting"""
     
-    def __init__(self, workspace_path: str = "/workspace"):
+    def __init__(self, workspace_path: str = "/workspace", executor: Optional[Executor] = None):
         self.workspace_path = Path(workspace_path)
-        self.excel_processor = ExcelProcessor()
+        
+        # Excel sheet scans are CPU-bound regex/pandas work; running them in worker
+        # processes keeps the event loop free for link validation and PDF analysis.
+        # An embedding caller passes its own pool and stays responsible for it.
+        self._owns_executor = executor is None
+        self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count()) if executor is None else executor
+        self.excel_processor = ExcelProcessor(executor=self._cpu_pool)
         self.pdf_analyzer = PDFAnalyzer()
         self.link_validator = LinkValidator()
         self.config_agent = ConfigurationAgent()
         
-        # Initialize tools
+        # Initialize tools; the set is fixed, so its listing is dumped once
         self.tools = self._initialize_tools()
+        self._tools_dump = [tool.model_dump() for tool in self.tools]
+        
+        # Tool name -> handler coroutine
+        self._dispatch = {
+            "process_excel_config": self._process_excel_config,
+            "analyze_error_pdf": self._analyze_error_pdf,
+            "validate_configuration_links": self._validate_configuration_links,
+            "automated_troubleshooting": self._automated_troubleshooting,
+            "configuration_validation": self._configuration_validation
+        }
         
         logger.info(f"MCP Server initialized with workspace: {workspace_path}")
     
@@ -53,7 +72,8 @@ class MCPServer:
                     "properties": {
                         "file_path": {"type": "string", "description": "Path to Excel file"},
                         "sheet_name": {"type": "string", "description": "Sheet name to process"},
-                        "config_type": {"type": "string", "description": "Type of configuration (network, database, system)"}
+                        "config_type": {"type": "string", "description": "Type of configuration (network, database, system)"},
+                        "deep_scan": {"type": "boolean", "description": "Scan every cell even when no header looks like configuration data"}
                     },
                     "required": ["file_path"]
                 }
@@ -116,28 +136,20 @@ class MCPServer:
     async def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP tool calls"""
         try:
-            if tool_name == "process_excel_config":
-                return await self._process_excel_config(**arguments)
-            elif tool_name == "analyze_error_pdf":
-                return await self._analyze_error_pdf(**arguments)
-            elif tool_name == "validate_configuration_links":
-                return await self._validate_configuration_links(**arguments)
-            elif tool_name == "automated_troubleshooting":
-                return await self._automated_troubleshooting(**arguments)
-            elif tool_name == "configuration_validation":
-                return await self._configuration_validation(**arguments)
-            else:
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
                 return {"error": f"Unknown tool: {tool_name}"}
+            return await handler(**arguments)
         except Exception as e:
             logger.error(f"Error handling tool call {tool_name}: {str(e)}")
             return {"error": f"Tool execution failed: {str(e)}"}
     
     async def _process_excel_config(self, file_path: str, sheet_name: Optional[str] = None, 
-                                  config_type: str = "general") -> Dict[str, Any]:
+                                  config_type: str = "general", deep_scan: bool = False) -> Dict[str, Any]:
         """Process Excel configuration files"""
         try:
             result = await self.excel_processor.process_file(
-                file_path, sheet_name, config_type
+                file_path, sheet_name, config_type, deep_scan
             )
             return {
                 "success": True,
@@ -199,7 +211,6 @@ class MCPServer:
                                       config_format: Optional[str] = None) -> Dict[str, Any]:
         """Validate configuration files"""
         try:
-            from ..validators.config_validator import ConfigValidator
             validator = ConfigValidator()
             
             result = await validator.validate_config(
@@ -214,8 +225,13 @@ class MCPServer:
             return {"success": False, "error": str(e)}
     
     def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available MCP tools"""
-        return [tool.model_dump() for tool in self.tools]
+        """Get list of available MCP tools (shared; callers must not mutate it)"""
+        return self._tools_dump
+    
+    def shutdown(self):
+        """Stop the worker processes used for Excel processing, if this server started them"""
+        if self._owns_executor:
+            self._cpu_pool.shutdown(cancel_futures=True)
 
 
 if __name__ == "__main__":
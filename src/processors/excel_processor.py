@@ -2,18 +2,93 @@
 Excel Processor for Configuration Data Extraction and Analysis
 """
 
+import asyncio
+import numpy as np
 import pandas as pd
-import json
-from typing import Dict, List, Any, Optional, Union
+import openpyxl
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple, Union
 from pathlib import Path
 from loguru import logger
 import re
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from ipaddress import IPv4Address
+
+# Optional Rust-backed workbook reader (pandas >= 2.2 exposes it as the "calamine" engine)
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_ipv4(ip: str) -> bool:
+    """Check a dotted-quad IPv4 address; sheets repeat the same addresses a lot"""
+    try:
+        IPv4Address(ip)
+        return True
+    except (ValueError, AttributeError):
+        return False
 
 
 class ExcelProcessor:
     """Process Excel files for configuration data extraction and validation"""
     
-    def __init__(self):
+    # Header keywords marking configuration columns for each config type
+    _CONFIG_KEYWORDS = {
+        'network': frozenset({'ip', 'port', 'host', 'server', 'gateway', 'dns', 'subnet', 'vlan'}),
+        'database': frozenset({'connection', 'server', 'database', 'table', 'user', 'password', 'port', 'timeout'}),
+        'system': frozenset({'path', 'directory', 'file', 'service', 'process', 'memory', 'cpu', 'disk'}),
+        'general': frozenset({'config', 'setting', 'parameter', 'option', 'value', 'property'})
+    }
+    
+    # One alternation per config type finds any keyword within a header
+    _CONFIG_KEYWORD_RES = {
+        config_type: re.compile("|".join(map(re.escape, sorted(keywords))))
+        for config_type, keywords in _CONFIG_KEYWORDS.items()
+    }
+    
+    # Header words that hint at pattern-bearing cells without being configuration keys
+    _PATTERN_HINTS = {
+        'network': frozenset({'address', 'mac', 'subnet', 'cidr', 'endpoint', 'url'}),
+        'database': frozenset({'dsn', 'query', 'sql', 'schema'}),
+        'system': frozenset({'env', 'variable', 'unit', 'daemon'})
+    }
+    
+    # Sheets longer than this have their patterns chosen per column from a row sample
+    _SAMPLE_SCAN_MIN_ROWS = 5000
+    _SAMPLE_SCAN_ROWS = 500
+    
+    # Files above this size are streamed row by row instead of loaded whole
+    _STREAM_MIN_BYTES = 50 * 1024 ** 2
+    _STREAM_CHUNK_ROWS = 5000
+    _STREAMABLE_FORMATS = frozenset({'.xlsx', '.xlsm'})
+    # Streamed workbooks with more sheets than this get one executor task per sheet
+    _STREAM_PARALLEL_MIN_SHEETS = 2
+    
+    # Cell strings pandas.read_excel treats as missing; streamed rows apply the same rule
+    _NA_STRINGS = frozenset({
+        '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+        '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+    })
+    
+    # Processed files kept per processor, keyed on path, sheet, mtime, size and options
+    _RESULT_CACHE_MAX_ENTRIES = 64
+    
+    # Password cell values that mean "not set"
+    _PASSWORD_PLACEHOLDERS = frozenset({'', 'null', 'none'})
+    
+    # Default or trivially weak credential values (compared lower-cased)
+    _WEAK_CREDENTIALS = frozenset({'admin', 'administrator', 'root', 'password', '123456'})
+    
+    def __init__(self, executor: Optional[Executor] = None):
+        # Sheets are processed in this executor; None uses the event loop default
+        self._executor = executor
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
         self.supported_formats = ['.xlsx', '.xls', '.xlsm']
         self.config_patterns = {
             'network': {
@@ -33,10 +108,54 @@ class ExcelProcessor:
                 'service_name': r'\b[a-zA-Z][a-zA-Z0-9\-_]*\.service\b'
             }
         }
+        
+        # Compile every pattern once instead of on each cell lookup
+        self._compiled_patterns = {
+            config_type: {
+                pattern_name: re.compile(pattern_regex, re.IGNORECASE)
+                for pattern_name, pattern_regex in patterns.items()
+            }
+            for config_type, patterns in self.config_patterns.items()
+        }
+        
+        # All patterns of a config type as one alternation, so a cell is searched once
+        # before any per-pattern findall; inline flags are dropped as IGNORECASE covers them
+        self._combined_patterns = {
+            config_type: re.compile(
+                "|".join(
+                    f"(?P<{pattern_name}>{pattern_regex.removeprefix('(?i)')})"
+                    for pattern_name, pattern_regex in patterns.items()
+                ),
+                re.IGNORECASE
+            )
+            for config_type, patterns in self.config_patterns.items()
+            if patterns
+        }
+        
+        # Any keyword or hint within a header makes a sheet worth the cell-level pattern scan
+        self._header_indicator_res = {
+            config_type: re.compile("|".join(map(
+                re.escape, sorted(keywords | self._PATTERN_HINTS.get(config_type, frozenset()))
+            )))
+            for config_type, keywords in self._CONFIG_KEYWORDS.items()
+        }
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Sheets may be sent to worker processes; the executor itself stays behind
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_result_cache"] = OrderedDict()
+        return state
     
     async def process_file(self, file_path: str, sheet_name: Optional[str] = None, 
-                          config_type: str = "general") -> Dict[str, Any]:
-        """Process Excel file and extract configuration data"""
+                          config_type: str = "general", deep_scan: bool = False) -> Dict[str, Any]:
+        """Process Excel file and extract configuration data
+        
+        Sheets whose headers give no hint of configuration data skip the cell-level
+        pattern scan, and very large sheets only scan each column for the patterns
+        found in a row sample, unless deep_scan is set. Results for unchanged files
+        are served from a cache and shared, so callers must not mutate them.
+        """
         try:
             file_path = Path(file_path)
             if not file_path.exists():
@@ -45,19 +164,29 @@ class ExcelProcessor:
             if file_path.suffix.lower() not in self.supported_formats:
                 raise ValueError(f"Unsupported file format: {file_path.suffix}")
             
+            file_stat = file_path.stat()
+            file_size = file_stat.st_size
+            cache_key = (str(file_path), sheet_name, file_stat.st_mtime_ns, file_size, config_type, deep_scan)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.info(f"Using cached analysis for Excel file: {file_path}")
+                return cached
+            
+            if file_size > self._STREAM_MIN_BYTES and file_path.suffix.lower() in self._STREAMABLE_FORMATS:
+                result = await self.process_file_streaming(file_path, sheet_name, config_type, deep_scan)
+                self._cache_result(cache_key, result)
+                return result
+            
             logger.info(f"Processing Excel file: {file_path}")
             
-            # Read Excel file
-            if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                sheets_data = {sheet_name: df}
-            else:
-                sheets_data = pd.read_excel(file_path, sheet_name=None)
+            # Read Excel file without blocking the event loop
+            sheets_data = await asyncio.to_thread(self._read_sheets, file_path, sheet_name)
             
             result = {
                 "file_info": {
                     "path": str(file_path),
-                    "size": file_path.stat().st_size,
+                    "size": file_size,
                     "sheets": list(sheets_data.keys())
                 },
                 "extracted_data": {},
@@ -65,39 +194,237 @@ class ExcelProcessor:
                 "validation_results": {}
             }
             
-            # Process each sheet
-            for sheet, df in sheets_data.items():
-                logger.info(f"Processing sheet: {sheet}")
-                
-                sheet_result = await self._process_sheet(df, config_type, sheet)
+            # Sheets are independent, so process them concurrently in the executor
+            loop = asyncio.get_running_loop()
+            sheet_results = await asyncio.gather(*(
+                loop.run_in_executor(self._executor, self._process_sheet, df, config_type, sheet, deep_scan)
+                for sheet, df in sheets_data.items()
+            ))
+            
+            for sheet, sheet_result in zip(sheets_data, sheet_results):
                 result["extracted_data"][sheet] = sheet_result["data"]
                 result["configuration_analysis"][sheet] = sheet_result["analysis"]
                 result["validation_results"][sheet] = sheet_result["validation"]
             
+            self._cache_result(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"Error processing Excel file {file_path}: {str(e)}")
             raise
     
-    async def _process_sheet(self, df: pd.DataFrame, config_type: str, sheet_name: str) -> Dict[str, Any]:
+    def _cache_result(self, cache_key: Tuple[Any, ...], result: Dict[str, Any]):
+        """Remember a processed file, evicting the least recently used entry when full"""
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self._RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+    
+    async def process_file_streaming(self, file_path: str, sheet_name: Optional[str] = None,
+                                     config_type: str = "general", deep_scan: bool = False) -> Dict[str, Any]:
+        """Process an .xlsx/.xlsm file row by row, keeping only one chunk of rows in memory"""
+        try:
+            file_path = Path(file_path)
+            if not file_path.exists():
+                raise FileNotFoundError(f"Excel file not found: {file_path}")
+            
+            logger.info(f"Streaming Excel file: {file_path}")
+            
+            sheet_names = [sheet_name] if sheet_name else await asyncio.to_thread(self._list_sheets, file_path)
+            
+            # Each task reopens the workbook, so only fan out once there are enough sheets to pay for it
+            if len(sheet_names) > self._STREAM_PARALLEL_MIN_SHEETS:
+                sheet_groups = [[name] for name in sheet_names]
+            else:
+                sheet_groups = [sheet_names]
+            
+            loop = asyncio.get_running_loop()
+            group_results = await asyncio.gather(*(
+                loop.run_in_executor(self._executor, self._stream_sheets, file_path, names, config_type, deep_scan)
+                for names in sheet_groups
+            ))
+            sheet_results = {
+                sheet: sheet_result
+                for group_result in group_results
+                for sheet, sheet_result in group_result.items()
+            }
+            
+            result = {
+                "file_info": {
+                    "path": str(file_path),
+                    "size": file_path.stat().st_size,
+                    "sheets": list(sheet_results.keys())
+                },
+                "extracted_data": {},
+                "configuration_analysis": {},
+                "validation_results": {}
+            }
+            
+            for sheet, sheet_result in sheet_results.items():
+                result["extracted_data"][sheet] = sheet_result["data"]
+                result["configuration_analysis"][sheet] = sheet_result["analysis"]
+                result["validation_results"][sheet] = sheet_result["validation"]
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error streaming Excel file {file_path}: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _list_sheets(file_path: Path) -> List[str]:
+        """Name the sheets of a workbook without reading any of their rows"""
+        if CALAMINE_AVAILABLE:
+            with CalamineWorkbook.from_path(str(file_path)) as workbook:
+                return list(workbook.sheet_names)
+        
+        workbook = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+    
+    def _stream_sheets(self, file_path: Path, sheet_names: List[str], config_type: str,
+                       deep_scan: bool) -> Dict[str, Dict[str, Any]]:
+        """Stream the named sheets of a read-only workbook"""
+        if CALAMINE_AVAILABLE:
+            # Native XML parsing; rows still reach Python one at a time
+            with CalamineWorkbook.from_path(str(file_path)) as workbook:
+                return {
+                    name: self._stream_sheet(workbook.get_sheet_by_name(name).iter_rows(), config_type, name, deep_scan)
+                    for name in sheet_names
+                }
+        
+        # read_only streams rows lazily; external link parts are never needed for analysis
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            return {
+                name: self._stream_sheet(workbook[name].iter_rows(values_only=True), config_type, name, deep_scan)
+                for name in sheet_names
+            }
+        finally:
+            workbook.close()
+    
+    def _stream_sheet(self, rows: Iterator[Sequence[Any]], config_type: str, sheet_name: str,
+                      deep_scan: bool) -> Dict[str, Any]:
+        """Scan a worksheet's rows in fixed-size chunks and merge the per-chunk results"""
+        logger.info(f"Streaming sheet: {sheet_name}")
+        
+        header = next(rows, None) or ()
+        # openpyxl reports blank header cells as None, calamine as ""
+        columns = [f"Unnamed: {i}" if name is None or name == "" else name for i, name in enumerate(header)]
+        width = len(columns)
+        
+        scan = {
+            "patterns": {},
+            "security_issues": [],
+            "configuration_items": []
+        }
+        null_values = pd.Series(0, index=pd.Index(columns, dtype=object), dtype="int64")
+        seen_rows = set()
+        duplicate_rows = 0
+        row_count = 0
+        first_chunk = None
+        
+        while True:
+            chunk = [self._stream_row(row, width) for row in islice(rows, self._STREAM_CHUNK_ROWS)]
+            if not chunk:
+                break
+            
+            # Duplicates are tracked by row hash so earlier chunks need not be kept
+            for row in chunk:
+                row_hash = hash(row)
+                if row_hash in seen_rows:
+                    duplicate_rows += 1
+                else:
+                    seen_rows.add(row_hash)
+            
+            df = pd.DataFrame.from_records(chunk, columns=columns)
+            df.index = pd.RangeIndex(row_count, row_count + len(df))
+            row_count += len(df)
+            if first_chunk is None:
+                first_chunk = df
+            
+            null_values += df.isnull().sum().to_numpy()
+            
+            chunk_scan = self._scan_sheet(df, config_type, deep_scan)
+            for column, column_patterns in chunk_scan["patterns"].items():
+                detected = scan["patterns"].setdefault(column, {})
+                for pattern_name, matches in column_patterns.items():
+                    detected.setdefault(pattern_name, []).extend(matches)
+            scan["security_issues"].extend(chunk_scan["security_issues"])
+            scan["configuration_items"].extend(chunk_scan["configuration_items"])
+        
+        if first_chunk is None:
+            first_chunk = pd.DataFrame(columns=columns)
+        
+        data_quality = self._data_quality(first_chunk, null_values, duplicate_rows, row_count)
+        
+        return {
+            "data": {
+                "rows": row_count,
+                "columns": width,
+                "column_names": columns,
+                "data_types": self._data_types(first_chunk),
+                "null_values": null_values.to_dict(),
+                "sample_data": first_chunk.head(3).to_dict('records') if not first_chunk.empty else []
+            },
+            "analysis": self._analyze_configuration_patterns(first_chunk, scan),
+            "validation": self._validate_configuration_data(first_chunk, scan, data_quality)
+        }
+    
+    def _stream_row(self, row: Sequence[Any], width: int) -> Tuple[Any, ...]:
+        """Pad or trim a streamed row to the header width, converting cells as pandas.read_excel does"""
+        return tuple(
+            None if isinstance(value, str) and value in self._NA_STRINGS
+            else int(value) if isinstance(value, float) and value.is_integer()
+            else value
+            for value in row[:width]
+        ) + (None,) * (width - len(row))
+    
+    def _read_sheets(self, file_path: Path, sheet_name: Optional[str]) -> Dict[str, pd.DataFrame]:
+        """Read the requested sheets, opening the workbook once"""
+        with self._open_workbook(file_path) as workbook:
+            sheet_names = [sheet_name] if sheet_name else workbook.sheet_names
+            return {name: workbook.parse(name) for name in sheet_names}
+    
+    @staticmethod
+    def _open_workbook(file_path: Path) -> pd.ExcelFile:
+        """Open a workbook with calamine when available, otherwise pandas' default engine"""
+        if CALAMINE_AVAILABLE:
+            try:
+                return pd.ExcelFile(file_path, engine="calamine")
+            except ValueError:
+                # pandas releases before 2.2 do not know the calamine engine
+                logger.debug("calamine engine unavailable in this pandas, using default engine")
+        return pd.ExcelFile(file_path)
+    
+    def _process_sheet(self, df: pd.DataFrame, config_type: str, sheet_name: str,
+                       deep_scan: bool = False) -> Dict[str, Any]:
         """Process individual Excel sheet"""
         try:
+            logger.info(f"Processing sheet: {sheet_name}")
+            
+            # Null counts feed both the summary and the data quality checks
+            nulls = df.isnull().sum()
+            
             # Basic data extraction
             data_summary = {
                 "rows": len(df),
                 "columns": len(df.columns),
                 "column_names": df.columns.tolist(),
-                "data_types": df.dtypes.to_dict(),
-                "null_values": df.isnull().sum().to_dict(),
+                "data_types": self._data_types(df),
+                "null_values": nulls.to_dict(),
                 "sample_data": df.head(3).to_dict('records') if not df.empty else []
             }
             
+            # Visit every column once for patterns, credentials and configuration items
+            scan = self._scan_sheet(df, config_type, deep_scan)
+            
             # Configuration pattern analysis
-            config_analysis = await self._analyze_configuration_patterns(df, config_type)
+            config_analysis = self._analyze_configuration_patterns(df, scan)
             
             # Data validation
-            validation_results = await self._validate_configuration_data(df, config_type)
+            validation_results = self._validate_configuration_data(df, scan, self._data_quality(df, nulls))
             
             return {
                 "data": data_summary,
@@ -109,46 +436,78 @@ class ExcelProcessor:
             logger.error(f"Error processing sheet {sheet_name}: {str(e)}")
             raise
     
-    async def _analyze_configuration_patterns(self, df: pd.DataFrame, config_type: str) -> Dict[str, Any]:
+    def _scan_sheet(self, df: pd.DataFrame, config_type: str, deep_scan: bool = False) -> Dict[str, Any]:
+        """Collect pattern matches, security issues and configuration items in one pass over the columns"""
+        scan = {
+            "patterns": {},
+            "security_issues": [],
+            "configuration_items": []
+        }
+        
+        try:
+            patterns = self._compiled_patterns.get(config_type, {})
+            combined = self._combined_patterns.get(config_type)
+            headers = self._lowered_headers(df)
+            if combined is not None and not deep_scan and not self._has_indicative_headers(headers, config_type):
+                # Nothing in the headers suggests configuration data, so skip the cell scan
+                logger.debug(f"No {config_type} headers found, skipping pattern scan")
+                combined = None
+            
+            # On very large sheets a fixed row sample decides which patterns each column is scanned for
+            sample = None
+            if combined is not None and not deep_scan and len(df) > self._SAMPLE_SCAN_MIN_ROWS:
+                sample = df.sample(self._SAMPLE_SCAN_ROWS, random_state=0)
+            
+            text_columns = set(self._text_columns(df))
+            row_labels = df.index.tolist()
+            positioned_items = []
+            
+            # Whether a cell is a configuration item depends only on its header
+            keyword_re = self._CONFIG_KEYWORD_RES.get(config_type, self._CONFIG_KEYWORD_RES['general'])
+            configuration_keys = headers.str.contains(keyword_re).tolist()
+            
+            for column, is_configuration_key in zip(df.columns, configuration_keys):
+                values = df[column]
+                
+                # Text cells feed both the pattern search and the credential checks
+                if column in text_columns:
+                    text_values = self._text_cells(values)
+                    if not text_values.empty:
+                        column_patterns = self._match_patterns(
+                            text_values,
+                            patterns if sample is None else self._sampled_patterns(sample[column], patterns),
+                            combined
+                        )
+                        if column_patterns:
+                            scan["patterns"][column] = column_patterns
+                        scan["security_issues"].extend(self._find_security_issues(column, text_values))
+                
+                if is_configuration_key:
+                    key = str(column)
+                    positioned_items.extend(
+                        self._collect_configuration_items(key, values, row_labels, config_type)
+                    )
+            
+            # Report items in row order, then column order
+            positioned_items.sort(key=itemgetter(0))
+            scan["configuration_items"] = [item for _, item in positioned_items]
+            
+        except Exception as e:
+            logger.error(f"Error scanning sheet: {str(e)}")
+        
+        return scan
+    
+    def _analyze_configuration_patterns(self, df: pd.DataFrame, scan: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze configuration patterns in the data"""
         analysis = {
-            "detected_patterns": {},
-            "configuration_items": [],
+            "detected_patterns": scan["patterns"],
+            "configuration_items": scan["configuration_items"],
             "potential_issues": []
         }
         
         try:
-            patterns = self.config_patterns.get(config_type, {})
-            
-            # Search for configuration patterns in all text columns
-            for column in df.columns:
-                if df[column].dtype == 'object':  # Text columns
-                    column_analysis = {}
-                    
-                    for pattern_name, pattern_regex in patterns.items():
-                        matches = []
-                        for idx, value in df[column].items():
-                            if pd.notna(value) and isinstance(value, str):
-                                found_matches = re.findall(pattern_regex, value, re.IGNORECASE)
-                                if found_matches:
-                                    matches.extend([{
-                                        "row": idx,
-                                        "value": value,
-                                        "matches": found_matches
-                                    }])
-                        
-                        if matches:
-                            column_analysis[pattern_name] = matches
-                    
-                    if column_analysis:
-                        analysis["detected_patterns"][column] = column_analysis
-            
-            # Extract configuration items
-            config_items = await self._extract_configuration_items(df, config_type)
-            analysis["configuration_items"] = config_items
-            
             # Identify potential issues
-            issues = await self._identify_potential_issues(df, analysis["detected_patterns"])
+            issues = self._identify_potential_issues(df, analysis["detected_patterns"])
             analysis["potential_issues"] = issues
             
             return analysis
@@ -157,44 +516,119 @@ class ExcelProcessor:
             logger.error(f"Error analyzing configuration patterns: {str(e)}")
             return analysis
     
-    async def _extract_configuration_items(self, df: pd.DataFrame, config_type: str) -> List[Dict[str, Any]]:
-        """Extract specific configuration items from the data"""
-        config_items = []
+    @staticmethod
+    def _lowered_headers(df: pd.DataFrame) -> pd.Index:
+        """Headers as lower-case strings, so keyword checks run over all columns at once"""
+        return df.columns.astype(str).str.lower()
+    
+    def _has_indicative_headers(self, headers: pd.Index, config_type: str) -> bool:
+        """Check whether any header mentions a configuration keyword or pattern hint"""
+        indicator = self._header_indicator_res.get(config_type)
+        if indicator is None:
+            return True
+        return bool(headers.str.contains(indicator).any())
+    
+    @staticmethod
+    def _text_columns(df: pd.DataFrame) -> pd.Index:
+        """Columns that can hold text, selected once per sheet"""
+        return df.select_dtypes(include=['object', 'string']).columns
+    
+    @staticmethod
+    def _text_cells(values: pd.Series) -> pd.Series:
+        """Non-null string cells of a column, with their original row labels"""
+        return values[[isinstance(value, str) for value in values]]
+    
+    def _match_patterns(self, text_values: pd.Series, patterns: Dict[str, re.Pattern],
+                        combined: Optional[re.Pattern]) -> Dict[str, List[Dict[str, Any]]]:
+        """Find configuration patterns in a column's text cells"""
+        column_analysis = {}
+        if combined is None or not patterns:
+            return column_analysis
         
-        try:
-            # Look for key-value pairs in the data
-            for idx, row in df.iterrows():
-                for col in df.columns:
-                    value = row[col]
-                    if pd.notna(value):
-                        # Check if this looks like a configuration item
-                        if self._is_configuration_item(str(col), str(value), config_type):
-                            config_items.append({
-                                "row": idx,
-                                "key": str(col),
-                                "value": str(value),
-                                "type": self._classify_config_item(str(col), str(value), config_type)
-                            })
-            
-            return config_items
+        # Configuration sheets repeat the same values a lot, so each distinct string is
+        # searched once. Values matching none of the patterns are dropped after a single
+        # search; the rest still get a findall per pattern so overlapping matches (a port
+        # inside an IP address, an IP inside a subnet) are all reported
+        candidates = [value for value in pd.unique(text_values.to_numpy()) if combined.search(value) is not None]
+        if not candidates:
+            return column_analysis
+        text_rows, text_array = text_values.index, text_values.to_numpy()
+        
+        for pattern_name, compiled in patterns.items():
+            found = {}
+            for value in candidates:
+                value_matches = compiled.findall(value)
+                if value_matches:
+                    found[value] = value_matches
+            if not found:
+                continue
             
-        except Exception as e:
-            logger.error(f"Error extracting configuration items: {str(e)}")
-            return []
+            # Broadcast each distinct value's matches back to every row holding it
+            hit = text_values.isin(list(found)).to_numpy()
+            column_analysis[pattern_name] = [
+                {"row": idx, "value": value, "matches": found[value]}
+                for idx, value in zip(text_rows[hit], text_array[hit])
+            ]
+        
+        return column_analysis
     
-    def _is_configuration_item(self, key: str, value: str, config_type: str) -> bool:
-        """Check if a key-value pair represents a configuration item"""
-        config_keywords = {
-            'network': ['ip', 'port', 'host', 'server', 'gateway', 'dns', 'subnet', 'vlan'],
-            'database': ['connection', 'server', 'database', 'table', 'user', 'password', 'port', 'timeout'],
-            'system': ['path', 'directory', 'file', 'service', 'process', 'memory', 'cpu', 'disk'],
-            'general': ['config', 'setting', 'parameter', 'option', 'value', 'property']
+    def _sampled_patterns(self, sample_values: pd.Series, patterns: Dict[str, re.Pattern]) -> Dict[str, re.Pattern]:
+        """Patterns that match at least one text cell of a column's row sample"""
+        sample_text = self._text_cells(sample_values).tolist()
+        return {
+            pattern_name: compiled
+            for pattern_name, compiled in patterns.items()
+            if any(compiled.search(value) for value in sample_text)
         }
+    
+    def _find_security_issues(self, column: Any, text_values: pd.Series) -> List[Dict[str, Any]]:
+        """Find hardcoded passwords and default credentials in a column's text cells"""
+        security_issues = []
         
-        keywords = config_keywords.get(config_type, config_keywords['general'])
-        key_lower = key.lower()
+        # Flag the whole column at once, then report only the flagged rows
+        if 'password' in str(column).lower():
+            hardcoded = (~text_values.isin(self._PASSWORD_PLACEHOLDERS)).to_numpy()
+        else:
+            hardcoded = np.zeros(len(text_values), dtype=bool)
+        weak = text_values.str.lower().isin(self._WEAK_CREDENTIALS).to_numpy()
+        flagged = hardcoded | weak
+        
+        for idx, is_hardcoded, is_weak in zip(text_values.index[flagged], hardcoded[flagged], weak[flagged]):
+            # Check for hardcoded passwords
+            if is_hardcoded:
+                security_issues.append({
+                    "type": "hardcoded_password",
+                    "location": f"Row {idx}, Column {column}",
+                    "severity": "high",
+                    "description": "Hardcoded password detected"
+                })
+            
+            # Check for default credentials
+            if is_weak:
+                security_issues.append({
+                    "type": "default_credentials",
+                    "location": f"Row {idx}, Column {column}",
+                    "severity": "high",
+                    "description": "Default/weak credentials detected"
+                })
         
-        return any(keyword in key_lower for keyword in keywords)
+        return security_issues
+    
+    def _collect_configuration_items(self, key: str, values: pd.Series, row_labels: List[Any],
+                                     config_type: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """Configuration items of one column, paired with their row positions"""
+        item_type = self._classify_config_item(key, "", config_type)
+        present = values.notna().to_numpy()
+        cells = values.tolist()
+        return [
+            (position, {
+                "row": row_labels[position],
+                "key": key,
+                "value": str(cells[position]),
+                "type": item_type
+            })
+            for position in present.nonzero()[0].tolist()
+        ]
     
     def _classify_config_item(self, key: str, value: str, config_type: str) -> str:
         """Classify the type of configuration item"""
@@ -231,7 +665,32 @@ class ExcelProcessor:
         
         return 'general'
     
-    async def _validate_configuration_data(self, df: pd.DataFrame, config_type: str) -> Dict[str, Any]:
+    @staticmethod
+    def _data_types(df: pd.DataFrame) -> Dict[Any, str]:
+        """Column dtypes as plain strings, ready for JSON"""
+        return dict(zip(df.columns.tolist(), df.dtypes.astype(str).tolist()))
+    
+    @staticmethod
+    def _data_quality(df: pd.DataFrame, nulls: pd.Series, duplicate_rows: Optional[int] = None,
+                      row_count: Optional[int] = None) -> Dict[str, Any]:
+        """Missing values, duplicate rows and empty cell share of a sheet
+        
+        Streamed sheets pass their accumulated duplicate and row counts; otherwise
+        both are taken from df.
+        """
+        if duplicate_rows is None:
+            duplicate_rows = int(df.duplicated().sum())
+        if row_count is None:
+            row_count = len(df)
+        cell_count = row_count * len(df.columns)
+        return {
+            "missing_values": nulls.to_dict(),
+            "duplicate_rows": duplicate_rows,
+            "empty_cells_percentage": (int(nulls.sum()) / cell_count) * 100 if cell_count else float("nan")
+        }
+    
+    def _validate_configuration_data(self, df: pd.DataFrame, scan: Dict[str, Any],
+                                     data_quality: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate configuration data for common issues"""
         validation = {
             "data_quality": {},
@@ -241,36 +700,11 @@ class ExcelProcessor:
         }
         
         try:
-            # Data quality checks
-            validation["data_quality"] = {
-                "missing_values": df.isnull().sum().to_dict(),
-                "duplicate_rows": df.duplicated().sum(),
-                "empty_cells_percentage": (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
-            }
+            # Data quality checks (callers usually pass these in, already computed)
+            validation["data_quality"] = data_quality or self._data_quality(df, df.isnull().sum())
             
-            # Security issue detection
-            security_issues = []
-            for column in df.columns:
-                if df[column].dtype == 'object':
-                    for idx, value in df[column].items():
-                        if pd.notna(value) and isinstance(value, str):
-                            # Check for hardcoded passwords
-                            if 'password' in column.lower() and value not in ['', 'null', 'none']:
-                                security_issues.append({
-                                    "type": "hardcoded_password",
-                                    "location": f"Row {idx}, Column {column}",
-                                    "severity": "high",
-                                    "description": "Hardcoded password detected"
-                                })
-                            
-                            # Check for default credentials
-                            if value.lower() in ['admin', 'administrator', 'root', 'password', '123456']:
-                                security_issues.append({
-                                    "type": "default_credentials",
-                                    "location": f"Row {idx}, Column {column}",
-                                    "severity": "high",
-                                    "description": "Default/weak credentials detected"
-                                })
+            # Security issues were collected while scanning the sheet
+            security_issues = scan["security_issues"]
             
             validation["security_issues"] = security_issues
             
@@ -293,7 +727,7 @@ class ExcelProcessor:
             logger.error(f"Error validating configuration data: {str(e)}")
             return validation
     
-    async def _identify_potential_issues(self, df: pd.DataFrame, detected_patterns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_potential_issues(self, df: pd.DataFrame, detected_patterns: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify potential configuration issues"""
         issues = []
         
@@ -343,16 +777,4 @@ class ExcelProcessor:
     
     def _is_valid_ip(self, ip: str) -> bool:
         """Validate IP address format"""
-        try:
-            parts = ip.split('.')
-            if len(parts) != 4:
-                return False
-            
-            for part in parts:
-                num = int(part)
-                if num < 0 or num > 255:
-                    return False
-            
-            return True
-        except (ValueError, AttributeError):
-            return False
\ No newline at end of file
+        return _is_valid_ipv4(ip)
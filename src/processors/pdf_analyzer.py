@@ -5,6 +5,7 @@ PDF Analyzer for Error Document Processing and Troubleshooting
 import re
 import json
 from typing import Dict, List, Any, Optional, Tuple
+from itertools import chain
 from pathlib import Path
 from loguru import logger
 import PyPDF2
@@ -63,6 +64,18 @@ class PDFAnalyzer:
             'medium': r'(?i)(medium|moderate|warning|caution)',
             'low': r'(?i)(low|minor|info|information|notice)'
         }
+        
+        # Compile every pattern once instead of on each line searched
+        self._compiled_error_patterns = {
+            category: {error_name: re.compile(pattern) for error_name, pattern in patterns.items()}
+            for category, patterns in self.error_patterns.items()
+        }
+        self._compiled_solution_patterns = {
+            solution_type: re.compile(pattern) for solution_type, pattern in self.solution_patterns.items()
+        }
+        self._compiled_severity_patterns = {
+            severity: re.compile(pattern) for severity, pattern in self.severity_patterns.items()
+        }
     
     async def analyze_document(self, file_path: str, error_type: Optional[str] = None,
                               extract_solutions: bool = True) -> Dict[str, Any]:
@@ -99,6 +112,11 @@ class PDFAnalyzer:
                 "errors_analysis": errors_analysis,
                 "solutions_analysis": solutions_analysis,
                 "recommendations": recommendations,
+                "flat_recommendations": list(chain(
+                    recommendations.get("immediate_actions", []),
+                    recommendations.get("investigation_steps", []),
+                    recommendations.get("preventive_measures", [])
+                )),
                 "analysis_timestamp": datetime.now().isoformat()
             }
             
@@ -181,10 +199,10 @@ class PDFAnalyzer:
             lines = text_content.split('\n')
             
             # Determine which error patterns to use
-            if error_type and error_type in self.error_patterns:
-                patterns_to_check = {error_type: self.error_patterns[error_type]}
+            if error_type and error_type in self._compiled_error_patterns:
+                patterns_to_check = {error_type: self._compiled_error_patterns[error_type]}
             else:
-                patterns_to_check = self.error_patterns
+                patterns_to_check = self._compiled_error_patterns
             
             # Search for error patterns
             for category, patterns in patterns_to_check.items():
@@ -194,7 +212,7 @@ class PDFAnalyzer:
                     matches = []
                     
                     for line_num, line in enumerate(lines, 1):
-                        if re.search(pattern, line):
+                        if pattern.search(line):
                             matches.append({
                                 "line_number": line_num,
                                 "text": line.strip(),
@@ -265,8 +283,8 @@ class PDFAnalyzer:
             
             # Check each line for severity indicators
             for line_num, line in enumerate(lines, 1):
-                for severity, pattern in self.severity_patterns.items():
-                    if re.search(pattern, line):
+                for severity, pattern in self._compiled_severity_patterns.items():
+                    if pattern.search(line):
                         severity_analysis["severity_distribution"][severity] += 1
                         severity_analysis["severity_details"].append({
                             "line_number": line_num,
@@ -327,11 +345,11 @@ class PDFAnalyzer:
             lines = text_content.split('\n')
             
             # Search for solution patterns
-            for solution_type, pattern in self.solution_patterns.items():
+            for solution_type, pattern in self._compiled_solution_patterns.items():
                 matches = []
                 
                 for line_num, line in enumerate(lines, 1):
-                    if re.search(pattern, line):
+                    if pattern.search(line):
                         matches.append({
                             "line_number": line_num,
                             "text": line.strip(),
@@ -5,12 +5,13 @@ Configuration Validator for Automated Configuration Validation
 import json
 import yaml
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 from loguru import logger
 import re
 import configparser
 from datetime import datetime
+from functools import lru_cache
 import jsonschema
 from jsonschema import validate, ValidationError
 
@@ -18,10 +19,33 @@ from jsonschema import validate, ValidationError
 class ConfigValidator:
     """Validate configuration files against best practices and standards"""
     
+    # Quoted JSON object keys, for the duplicate key check
+    _JSON_KEY_RE = re.compile(r'"([^"]+)"\s*:')
+    
     def __init__(self):
         self.validation_rules = self._initialize_validation_rules()
         self.security_rules = self._initialize_security_rules()
         self.performance_rules = self._initialize_performance_rules()
+        # Compile every pattern once instead of on each checked value; field rules
+        # also carry their lowercased names so keys are matched without re-lowering
+        self._field_format_checks = tuple(
+            (format_name, format_name.lower(), re.compile(pattern))
+            for format_name, pattern in self.validation_rules["field_formats"].items()
+        )
+        self._value_range_checks = tuple(
+            (range_name.lower(), range_info.get("min"), range_info.get("max"))
+            for range_name, range_info in self.validation_rules["value_ranges"].items()
+        )
+        self._sensitive_value_res = {
+            sensitive_field: re.compile(rf'{sensitive_field}\s*[=:]\s*["\']?([^"\'\s\n]+)', re.IGNORECASE)
+            for sensitive_field in self.security_rules["sensitive_fields"]
+        }
+        # Which format and range checks apply depends only on a key's lowercased name,
+        # so each distinct key resolves its checks once
+        self._format_checks_for_key = lru_cache(maxsize=1024)(self._resolve_format_checks)
+        self._range_checks_for_key = lru_cache(maxsize=1024)(self._resolve_range_checks)
+        # Hashed once so each string value is a single set lookup
+        self._insecure_values = frozenset(self.security_rules["insecure_values"])
         self.supported_formats = {
             'json': self._validate_json,
             'yaml': self._validate_yaml,
@@ -33,6 +57,22 @@ class ConfigValidator:
             'properties': self._validate_properties
         }
     
+    def _resolve_format_checks(self, key_lower: str) -> Tuple[Tuple[str, re.Pattern], ...]:
+        """Format checks whose name appears in a lowercased key"""
+        return tuple(
+            (format_name, compiled)
+            for format_name, format_name_lower, compiled in self._field_format_checks
+            if format_name_lower in key_lower
+        )
+    
+    def _resolve_range_checks(self, key_lower: str) -> Tuple[Tuple[Any, Any], ...]:
+        """Min/max bounds of the range rules whose name appears in a lowercased key"""
+        return tuple(
+            (min_val, max_val)
+            for range_name_lower, min_val, max_val in self._value_range_checks
+            if range_name_lower in key_lower
+        )
+    
     def _initialize_validation_rules(self) -> Dict[str, Any]:
         """Initialize general validation rules"""
         return {
@@ -125,8 +165,12 @@ class ConfigValidator:
     
     async def _validate_single_file(self, file_path: Path, 
                                    config_format: Optional[str] = None,
-                                   validation_rules: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Validate a single configuration file"""
+                                   validation_rules: Optional[List[str]] = None,
+                                   validation_timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Validate a single configuration file
+        
+        Directory runs pass one validation_timestamp shared by all of their files.
+        """
         try:
             # Determine format
             if not config_format:
@@ -157,12 +201,13 @@ class ConfigValidator:
             )
             
             # Compile results
+            file_stat = file_path.stat()
             result = {
                 "file_info": {
                     "path": str(file_path),
                     "format": config_format,
-                    "size": file_path.stat().st_size,
-                    "last_modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": file_stat.st_size,
+                    "last_modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
                 },
                 "validation_results": {
                     "format_validation": format_validation,
@@ -174,7 +219,7 @@ class ConfigValidator:
                     format_validation, general_validation, 
                     security_validation, performance_validation
                 ]),
-                "validation_timestamp": datetime.now().isoformat()
+                "validation_timestamp": validation_timestamp or datetime.now().isoformat()
             }
             
             return result
@@ -202,11 +247,14 @@ class ConfigValidator:
                     "message": "No configuration files found in directory"
                 }
             
-            # Validate each file
+            # Validate each file; the whole run shares one timestamp
+            validation_timestamp = datetime.now().isoformat()
             file_results = []
             for config_file in config_files:
                 try:
-                    file_result = await self._validate_single_file(config_file, None, validation_rules)
+                    file_result = await self._validate_single_file(
+                        config_file, None, validation_rules, validation_timestamp
+                    )
                     file_results.append(file_result)
                 except Exception as e:
                     file_results.append({
@@ -225,7 +273,7 @@ class ConfigValidator:
                 },
                 "file_results": file_results,
                 "directory_summary": directory_summary,
-                "validation_timestamp": datetime.now().isoformat()
+                "validation_timestamp": validation_timestamp
             }
             
         except Exception as e:
@@ -528,8 +576,9 @@ class ConfigValidator:
         # and check against specific requirements
         common_required = ["name", "version"]
         
+        field_index = self._build_field_index(parsed_data)
         for field in common_required:
-            if not self._find_field_in_data(parsed_data, field):
+            if not field_index.get(field.lower()):
                 result["warnings"].append(f"Recommended field '{field}' is missing")
         
         return result
@@ -544,9 +593,9 @@ class ConfigValidator:
                     current_path = f"{path}.{key}" if path else key
                     
                     # Check if this field has a format requirement
-                    for format_name, pattern in self.validation_rules["field_formats"].items():
-                        if format_name.lower() in key.lower() and isinstance(value, str):
-                            if not re.match(pattern, value):
+                    if isinstance(value, str):
+                        for format_name, compiled in self._format_checks_for_key(key.lower()):
+                            if not compiled.match(value):
                                 result["errors"].append(
                                     f"Field '{current_path}' has invalid {format_name} format: {value}"
                                 )
@@ -570,11 +619,8 @@ class ConfigValidator:
                     current_path = f"{path}.{key}" if path else key
                     
                     # Check if this field has range requirements
-                    for range_name, range_info in self.validation_rules["value_ranges"].items():
-                        if range_name.lower() in key.lower() and isinstance(value, (int, float)):
-                            min_val = range_info.get("min")
-                            max_val = range_info.get("max")
-                            
+                    if isinstance(value, (int, float)):
+                        for min_val, max_val in self._range_checks_for_key(key.lower()):
                             if min_val is not None and value < min_val:
                                 result["errors"].append(
                                     f"Field '{current_path}' value {value} is below minimum {min_val}"
@@ -598,13 +644,13 @@ class ConfigValidator:
         result = {"errors": [], "warnings": []}
         
         # Check for sensitive field names with values
-        for sensitive_field in self.security_rules["sensitive_fields"]:
+        for sensitive_field, compiled in self._sensitive_value_res.items():
             # Check in content (case-insensitive)
-            pattern = rf'{sensitive_field}\s*[=:]\s*["\']?([^"\'\s\n]+)'
-            matches = re.findall(pattern, content, re.IGNORECASE)
+            matches = compiled.findall(content)
+            placeholders = {'', 'null', 'none', '${VAR}', '${' + sensitive_field.upper() + '}'}
             
             for match in matches:
-                if match and match not in ['', 'null', 'none', '${VAR}', '${' + sensitive_field.upper() + '}']:
+                if match and match not in placeholders:
                     result["errors"].append(
                         f"Hardcoded {sensitive_field} detected: {match[:10]}..."
                     )
@@ -615,7 +661,7 @@ class ConfigValidator:
                 for key, value in data.items():
                     current_path = f"{path}.{key}" if path else key
                     
-                    if isinstance(value, str) and value.lower() in self.security_rules["insecure_values"]:
+                    if isinstance(value, str) and value.lower() in self._insecure_values:
                         result["warnings"].append(
                             f"Insecure default value detected at '{current_path}': {value}"
                         )
@@ -633,8 +679,9 @@ class ConfigValidator:
         """Check security requirements"""
         result = {"errors": [], "warnings": []}
         
+        field_index = self._build_field_index(parsed_data)
         for requirement, expected_value in self.security_rules["security_requirements"].items():
-            found_value = self._find_field_in_data(parsed_data, requirement)
+            found_value = field_index.get(requirement.lower())
             
             if found_value is None:
                 result["warnings"].append(f"Security setting '{requirement}' not found")
@@ -649,8 +696,9 @@ class ConfigValidator:
         """Check for dangerous settings"""
         result = {"errors": [], "warnings": []}
         
+        field_index = self._build_field_index(parsed_data)
         for setting, safe_value in self.security_rules["dangerous_settings"].items():
-            found_value = self._find_field_in_data(parsed_data, setting)
+            found_value = field_index.get(setting.lower())
             
             if found_value is not None and found_value != safe_value:
                 severity = "errors" if setting in ["disable_ssl_verification", "allow_all_origins"] else "warnings"
@@ -664,8 +712,9 @@ class ConfigValidator:
         """Check performance settings"""
         result = {"warnings": [], "info": []}
         
+        field_index = self._build_field_index(parsed_data)
         for setting, config in self.performance_rules["recommended_values"].items():
-            found_value = self._find_field_in_data(parsed_data, setting)
+            found_value = field_index.get(setting.lower())
             
             if found_value is not None and isinstance(found_value, (int, float)):
                 recommended = config.get("recommended")
@@ -692,54 +741,63 @@ class ConfigValidator:
         result = {"warnings": []}
         
         # Check for specific anti-patterns
-        timeout_value = self._find_field_in_data(parsed_data, "timeout")
+        field_index = self._build_field_index(parsed_data)
+        timeout_value = field_index.get("timeout")
         if timeout_value and isinstance(timeout_value, (int, float)):
             if timeout_value > self.performance_rules["performance_warnings"]["large_timeout_values"]:
                 result["warnings"].append(f"Very large timeout value detected: {timeout_value} seconds")
         
-        pool_size = self._find_field_in_data(parsed_data, "pool_size")
+        pool_size = field_index.get("pool_size")
         if pool_size and isinstance(pool_size, (int, float)):
             if pool_size < self.performance_rules["performance_warnings"]["small_pool_size"]:
                 result["warnings"].append(f"Small connection pool size may impact performance: {pool_size}")
         
-        retry_count = self._find_field_in_data(parsed_data, "retry")
+        retry_count = field_index.get("retry")
         if retry_count and isinstance(retry_count, (int, float)):
             if retry_count > self.performance_rules["performance_warnings"]["excessive_retry_count"]:
                 result["warnings"].append(f"Excessive retry count may cause delays: {retry_count}")
         
         return result
     
-    def _find_field_in_data(self, data: Any, field_name: str) -> Any:
-        """Find a field in nested data structure (case-insensitive)"""
+    def _build_field_index(self, data: Any) -> Dict[str, Any]:
+        """Index a nested data structure by lowercased key for case-insensitive lookups
+        
+        Each check looks up several settings, so it walks the document once
+        into an index instead of once per lookup.
+        """
+        field_index = {}
+        self._index_fields(data, field_index, top_level=True)
+        return field_index
+    
+    def _index_fields(self, data: Any, field_index: Dict[str, Any], top_level: bool = False):
+        """Record the first value of every key in depth-first order
+        
+        Nested null values are skipped so a later occurrence can be found; a null
+        at the top level hides later occurrences, as a direct lookup would.
+        """
         if isinstance(data, dict):
             for key, value in data.items():
-                if key.lower() == field_name.lower():
-                    return value
-                elif isinstance(value, (dict, list)):
-                    result = self._find_field_in_data(value, field_name)
-                    if result is not None:
-                        return result
+                key_lower = key.lower()
+                if key_lower not in field_index and (value is not None or top_level):
+                    field_index[key_lower] = value
+                if isinstance(value, (dict, list)):
+                    self._index_fields(value, field_index)
         elif isinstance(data, list):
             for item in data:
-                result = self._find_field_in_data(item, field_name)
-                if result is not None:
-                    return result
-        
-        return None
+                self._index_fields(item, field_index)
     
     def _has_duplicate_keys(self, json_content: str) -> bool:
         """Check for duplicate keys in JSON (simplified check)"""
         try:
             # This is a basic check - a more sophisticated implementation
             # would parse the JSON while tracking keys
-            keys_found = []
-            key_pattern = r'"([^"]+)"\s*:'
+            keys_found = set()
             
-            for match in re.finditer(key_pattern, json_content):
+            for match in self._JSON_KEY_RE.finditer(json_content):
                 key = match.group(1)
                 if key in keys_found:
                     return True
-                keys_found.append(key)
+                keys_found.add(key)
             
             return False
         except Exception:
@@ -14,10 +14,15 @@ import ssl
 import socket
 
 
+# Total pooled connections per session; concurrency is bounded by the
+# per-validation semaphore (max_concurrent)
+_CONNECTOR_LIMIT = 100
+
+
 class LinkValidator:
     """Validate links and external resources in configuration documents"""
     
-    def __init__(self, max_concurrent: int = 10, default_timeout: int = 10):
+    def __init__(self, max_concurrent: int = 50, default_timeout: int = 10):
         self.max_concurrent = max_concurrent
         self.default_timeout = default_timeout
         self.session = None
@@ -34,7 +39,7 @@ class LinkValidator:
     async def __aenter__(self):
         """Async context manager entry"""
         connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent,
+            limit=max(_CONNECTOR_LIMIT, self.max_concurrent),
             ssl=ssl.create_default_context()
         )
         self.session = aiohttp.ClientSession(
@@ -6,12 +6,18 @@ Test script for Agentic Configuration Research System
 import asyncio
 import sys
 import json
+import os
+import tempfile
+import time
 from pathlib import Path
 from loguru import logger
+import pandas as pd
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import src.agents.config_agent as config_agent_module
+from src.agents.config_agent import ConfigurationAgent
 from src.integration.cursor_integration import CursorIntegration
 from src.processors.excel_processor import ExcelProcessor
 from src.validators.config_validator import ConfigValidator
@@ -120,6 +126,329 @@ async def test_troubleshooting():
         return False
 
 
+def _write_header_probe_workbook(directory: str) -> Path:
+    """Workbook whose cells hold patterns under headers that hint at none"""
+    workbook = Path(directory) / "header_probe.xlsx"
+    pd.DataFrame({
+        "Database Connection": ["10.0.0.1", "10.0.0.2"],
+        "Notes": ["/etc/app.conf", "$HOME"]
+    }).to_excel(workbook, sheet_name="Config", index=False)
+    return workbook
+
+
+async def test_excel_header_prefilter():
+    """Test that sheets without configuration headers skip the pattern scan"""
+    print("🧪 Testing Excel Header Prefilter...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            workbook = _write_header_probe_workbook(directory)
+            processor = ExcelProcessor()
+            
+            for config_type in ("network", "system"):
+                result = await processor.process_file(str(workbook), config_type=config_type)
+                patterns = result["configuration_analysis"]["Config"]["detected_patterns"]
+                assert patterns == {}, f"{config_type} scan was not skipped: {patterns}"
+        
+        print(f"✅ Pattern scan skipped for sheets without configuration headers")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Excel header prefilter test failed: {str(e)}")
+        return False
+
+
+async def test_excel_deep_scan():
+    """Test that deep_scan scans every sheet regardless of its headers"""
+    print("🧪 Testing Excel Deep Scan...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            workbook = _write_header_probe_workbook(directory)
+            processor = ExcelProcessor()
+            
+            expected = {"network": ("Database Connection", "ip_address"), "system": ("Notes", "file_path")}
+            for config_type, (column, pattern) in expected.items():
+                # A cached shallow result must not be served for a deep scan
+                await processor.process_file(str(workbook), config_type=config_type)
+                result = await processor.process_file(str(workbook), config_type=config_type, deep_scan=True)
+                patterns = result["configuration_analysis"]["Config"]["detected_patterns"]
+                assert pattern in patterns.get(column, {}), f"{config_type} deep scan missed {pattern}: {patterns}"
+        
+        print(f"✅ Deep scan found patterns under non-configuration headers")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Excel deep scan test failed: {str(e)}")
+        return False
+
+
+def _touch_later(path: Path):
+    """Move a file's mtime forward without changing its size"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+async def test_research_cache():
+    """Test that research results are shared read-only and dropped on mtime or size changes"""
+    print("🧪 Testing Research Cache...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as workspace:
+            config_file = Path(workspace) / "app.json"
+            config_file.write_text(json.dumps({"database": {"host": "db", "port": 5432}}))
+            integration = CursorIntegration(workspace)
+            parameters = {"config_path": str(config_file)}
+            
+            first = await integration._run_cached_research("config_validation", parameters)
+            assert await integration._run_cached_research("config_validation", parameters) is first, \
+                "research result not reused"
+            try:
+                first["recommendations"] = []
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("cached research result is mutable")
+            json.dumps(first)
+            
+            _touch_later(config_file)
+            second = await integration._run_cached_research("config_validation", parameters)
+            assert second is not first, "research result reused after mtime change"
+            config_file.write_text(json.dumps({"database": {"host": "db"}}))
+            assert await integration._run_cached_research("config_validation", parameters) is not second, \
+                "research result reused after size change"
+        
+        print(f"✅ Research results reused read-only and invalidated on mtime and size changes")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Research cache test failed: {str(e)}")
+        return False
+
+
+async def test_config_analysis_cache():
+    """Test that per-file configuration analyses are reused until the file's mtime or size changes"""
+    print("🧪 Testing Configuration Analysis Cache...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as workspace:
+            config_file = Path(workspace) / "app.json"
+            config_file.write_text(json.dumps({"database": {"host": "db", "port": 5432}}))
+            agent = ConfigurationAgent()
+            
+            first = await agent._analyze_single_config_file(config_file)
+            assert await agent._analyze_single_config_file(config_file) is first, "config analysis not reused"
+            _touch_later(config_file)
+            second = await agent._analyze_single_config_file(config_file)
+            assert second is not first, "config analysis reused after mtime change"
+            config_file.write_text(json.dumps({"database": {"host": "db", "port": 5432, "debug": True}}))
+            assert await agent._analyze_single_config_file(config_file) is not second, \
+                "config analysis reused after size change"
+        
+        print(f"✅ Configuration analyses invalidated on mtime and size changes")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Configuration analysis cache test failed: {str(e)}")
+        return False
+
+
+async def test_issue_severity():
+    """Test that the most urgent matching severity wins regardless of indicator order"""
+    print("🧪 Testing Issue Severity...")
+    
+    try:
+        agent = ConfigurationAgent()
+        expected = {
+            # A medium indicator must not be downgraded by a later low one
+            "Warning: slow responses, see info log": "medium",
+            "Fatal error: request failed with a warning": "critical",
+            "Request failed, see the notice": "high",
+            "Debug trace attached": "low",
+            "Users report something odd": "medium"
+        }
+        for description, severity in expected.items():
+            analysis = await agent._analyze_issue_description(description)
+            assert analysis["severity"] == severity, \
+                f"{description!r}: expected {severity}, got {analysis['severity']}"
+        
+        print(f"✅ Issue severity picked by priority")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Issue severity test failed: {str(e)}")
+        return False
+
+
+class _CountingPattern:
+    """Wraps a compiled pattern, counting its searches"""
+    
+    def __init__(self, compiled, counter):
+        self._compiled = compiled
+        self._counter = counter
+    
+    def search(self, text):
+        self._counter.append(self._compiled.pattern)
+        return self._compiled.search(text)
+
+
+async def test_pattern_set_fallback():
+    """Test the re fallback of _PatternSet used when Hyperscan is not installed"""
+    print("🧪 Testing Pattern Set Fallback...")
+    
+    try:
+        patterns = [r"time\s*out", r"refused", r"dns", r"disk\s+full"]
+        hyperscan_available = config_agent_module.HYPERSCAN_AVAILABLE
+        config_agent_module.HYPERSCAN_AVAILABLE = False
+        try:
+            pattern_set = config_agent_module._PatternSet(patterns)
+        finally:
+            config_agent_module.HYPERSCAN_AVAILABLE = hyperscan_available
+        assert pattern_set._database is None, "fallback pattern set compiled a Hyperscan database"
+        
+        text = "Connection REFUSED after a timeout; DNS looked fine"
+        assert pattern_set.matching_ids(text) == {0, 1, 2}
+        
+        # Each pattern is searched exactly once, and hits come back in pattern order
+        searches = []
+        pattern_set._compiled = [_CountingPattern(compiled, searches) for compiled in pattern_set._compiled]
+        matches = [(index, match.group()) for index, match in pattern_set.matches(text)]
+        assert matches == [(0, "timeout"), (1, "REFUSED"), (2, "DNS")], f"unexpected matches: {matches}"
+        assert len(searches) == len(patterns), f"expected {len(patterns)} searches, got {len(searches)}"
+        assert pattern_set.matches("all good") == []
+        
+        print(f"✅ Pattern set fallback matched without Hyperscan")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Pattern set fallback test failed: {str(e)}")
+        return False
+
+
+class _RecordingWebSocket:
+    """Stand-in WebSocket client that records the text frames it is sent"""
+    
+    def __init__(self):
+        self.frames = []
+    
+    async def send_text(self, payload: str):
+        self.frames.append(json.loads(payload))
+
+
+async def test_websocket_frames():
+    """Test that lone updates are sent as-is and bursts as one batch frame"""
+    print("🧪 Testing WebSocket Update Frames...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as workspace:
+            integration = CursorIntegration(workspace)
+            client = _RecordingWebSocket()
+            integration.websocket_connections.add(client)
+            
+            async def wait_for_frames(count: int):
+                for _ in range(100):
+                    if len(client.frames) >= count:
+                        return
+                    await asyncio.sleep(0.01)
+            
+            try:
+                first = {"type": "task_completed", "task_id": "task_1", "result": {}}
+                integration._broadcast_update(first)
+                await wait_for_frames(1)
+                assert client.frames == [first], f"lone update was not sent as-is: {client.frames}"
+                
+                # Updates queued before the broadcaster runs are coalesced, in order
+                burst = [{"type": "task_completed", "task_id": f"task_{i}", "result": {}} for i in (2, 3)]
+                for message in burst:
+                    integration._broadcast_update(message)
+                await wait_for_frames(2)
+                assert client.frames[1:] == [{"type": "batch", "events": burst}], \
+                    f"burst was not sent as one batch frame: {client.frames[1:]}"
+            finally:
+                if integration._broadcast_task is not None:
+                    integration._broadcast_task.cancel()
+        
+        print(f"✅ WebSocket updates framed as single messages and batches")
+        
+        return True
+    except Exception as e:
+        print(f"❌ WebSocket frame test failed: {str(e)}")
+        return False
+
+
+async def test_background_research():
+    """Test that comprehensive analysis is accepted with 202 and can be polled to completion"""
+    print("🧪 Testing Background Research Tasks...")
+    
+    try:
+        from fastapi.testclient import TestClient
+        
+        sample_config = str(Path(__file__).parent / "data" / "sample_config.json")
+        with tempfile.TemporaryDirectory() as workspace:
+            integration = CursorIntegration(workspace)
+            with TestClient(integration.app) as client:
+                response = client.post("/research", json={
+                    "task_type": "comprehensive_analysis",
+                    "parameters": {"config_files": [sample_config]}
+                })
+                assert response.status_code == 202, f"expected 202, got {response.status_code}"
+                accepted = response.json()
+                assert accepted["status"] == "queued", f"expected queued, got {accepted['status']}"
+                
+                # Poll until the background task finishes
+                task_url = f"/research/{accepted['task_id']}"
+                for _ in range(300):
+                    task = client.get(task_url).json()
+                    if task["status"] in ("completed", "failed"):
+                        break
+                    time.sleep(0.1)
+                
+                assert task["status"] == "completed", f"task did not complete: {task}"
+                assert task["task_type"] == "comprehensive_analysis"
+                assert task["result"]["type"] == "comprehensive_analysis"
+                validated = [entry["file"] for entry in task["result"]["results"]["config_validation"]]
+                assert validated == [sample_config], f"unexpected validated files: {validated}"
+                
+                missing = client.get("/research/task_unknown")
+                assert missing.status_code == 404, f"expected 404 for unknown task, got {missing.status_code}"
+            integration.shutdown()
+        
+        print(f"✅ Comprehensive analysis queued with 202 and completed on polling")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Background research test failed: {str(e)}")
+        return False
+
+
+async def test_excel_result_cache():
+    """Test that processed Excel results are reused until the workbook's mtime or size changes"""
+    print("🧪 Testing Excel Result Cache...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as workspace:
+            workbook = Path(workspace) / "config.xlsx"
+            pd.DataFrame({"Host": ["10.0.0.1"], "Port": [8080]}).to_excel(workbook, index=False)
+            processor = ExcelProcessor()
+            
+            first = await processor.process_file(str(workbook), config_type="network")
+            assert await processor.process_file(str(workbook), config_type="network") is first, \
+                "Excel result not reused"
+            _touch_later(workbook)
+            second = await processor.process_file(str(workbook), config_type="network")
+            assert second is not first, "Excel result reused after mtime change"
+            pd.DataFrame({"Host": ["10.0.0.1", "10.0.0.2"], "Port": [8080, 8081]}).to_excel(workbook, index=False)
+            assert await processor.process_file(str(workbook), config_type="network") is not second, \
+                "Excel result reused after size change"
+        
+        print(f"✅ Excel results invalidated on mtime and size changes")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Excel result cache test failed: {str(e)}")
+        return False
+
+
 async def run_comprehensive_test():
     """Run comprehensive system test"""
     print("🎯 Running Comprehensive System Test")
@@ -132,7 +461,16 @@ async def run_comprehensive_test():
         ("Configuration Validation", test_config_validation),
         ("Link Validation", test_link_validation),
         ("Integration Layer", test_integration_layer),
-        ("Troubleshooting", test_troubleshooting)
+        ("Troubleshooting", test_troubleshooting),
+        ("Excel Header Prefilter", test_excel_header_prefilter),
+        ("Excel Deep Scan", test_excel_deep_scan),
+        ("Research Cache", test_research_cache),
+        ("Configuration Analysis Cache", test_config_analysis_cache),
+        ("Issue Severity", test_issue_severity),
+        ("Pattern Set Fallback", test_pattern_set_fallback),
+        ("WebSocket Frames", test_websocket_frames),
+        ("Background Research", test_background_research),
+        ("Excel Result Cache", test_excel_result_cache)
     ]
     
     for test_name, test_func in tests: